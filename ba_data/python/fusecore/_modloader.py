@@ -5,8 +5,10 @@ with our new core system.
 """
 
 from __future__ import annotations
+from concurrent.futures import Executor, Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
+import functools
 import json
 import logging
 import os
@@ -15,7 +17,7 @@ import importlib
 from pathlib import Path
 import shutil
 import sys
-from typing import Any, Literal, override
+from typing import Any, Iterable, Literal, override
 
 import bascenev1 as bs
 import bauiv1 as bui
@@ -34,10 +36,14 @@ def _log() -> logging.Logger:
     return logging.getLogger(__name__)
 
 
+@functools.cache
 def get_mods_resource_folder(
     resource: Literal["textures", "audio", "meshes"],
 ) -> Path:
-    """Get our BombSquad folders for mod assets."""
+    """Get our BombSquad folders for mod assets.
+
+    These don't move around while we run, so we only build them once.
+    """
     return Path(
         os.path.join(
             os.path.abspath(bs.app.env.data_directory),
@@ -50,6 +56,39 @@ def get_mods_resource_folder(
     )
 
 
+def _scan_filetree_times(path: str, buf: bytearray) -> None:
+    """Write the mtimes of all files under a folder into 'buf'.
+
+    Uses 'os.scandir' so we stat each file once through its entry
+    and only build paths for folders we have to step into.
+    Files and folders are visited in name order so the result
+    doesn't depend on how our OS lists them.
+    """
+    files: list[tuple[str, int]] = []
+    folders: list[str] = []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                try:
+                    # don't step into linked folders to avoid loops, but
+                    # do follow links to files so edits to them count.
+                    if entry.is_dir(follow_symlinks=False):
+                        folders.append(entry.path)
+                    else:
+                        stat = entry.stat()
+                        files.append((entry.name, stat.st_mtime_ns))
+                except OSError:
+                    continue
+    except OSError:
+        return
+
+    files.sort()
+    for _, mtime_ns in files:
+        buf += b"%d\n" % mtime_ns
+    for folder in sorted(folders):
+        _scan_filetree_times(folder, buf)
+
+
 class ModEntryType(Enum):
     """A mod's type.
 
@@ -64,6 +103,25 @@ class ModEntryType(Enum):
     COMPRESSED = 2
 
 
+MOD_FILE_TYPES: dict[str, ModEntryType] = {
+    ".py": ModEntryType.PLUGIN,
+    # TODO: '.bsmod' compressed mods will have their own
+    # file structure and we want to compensate for that...
+    ".bsmod": ModEntryType.PACKED,
+    ".zip": ModEntryType.COMPRESSED,
+    ".rar": ModEntryType.COMPRESSED,
+}
+"""Mod file extensions and the entry type they're loaded as."""
+UPDATEABLE_MOD_TYPES: frozenset[ModEntryType] = frozenset(
+    {ModEntryType.PLUGIN, ModEntryType.FOLDER}
+)
+"""Entry types we reload whenever they change."""
+
+TEXTURE_FILETYPES: frozenset[str] = frozenset({".png", ".dds", ".ktx"})
+AUDIO_FILETYPES: frozenset[str] = frozenset({".ogg"})
+MESH_FILETYPES: frozenset[str] = frozenset({".bob", ".cob"})
+
+
 @dataclass(frozen=True)
 class ModEntry:
     """Info. about an instanced mod."""
@@ -79,23 +137,142 @@ class ModEntry:
         system fails if the user goes out of his way to change files
         without updating their timestamp, but if so, it's well deserved.
         """
-        hasher = hashlib.sha1()
+        if not self.path.is_dir():
+            # A single file's timestamp is a fine fingerprint by itself.
+            return f"{self.path.stat().st_mtime_ns}"
+
+        # walk through folders and check if any
+        # files have had their timestamps updated
+        # (which usually means they changed)
+        buf = bytearray()
+        _scan_filetree_times(str(self.path), buf)
+        # We only compare these against each other while running,
+        # so Python's own (way faster) bytes hash does the job.
+        return f"{hash(bytes(buf)) & 0xFFFFFFFFFFFFFFFF:016x}"
+
+
+def _scan_mod_path(
+    path: Path, last_mtime: int | None, known_paths: set[str]
+) -> tuple[int | None, list[ModEntry]]:
+    """Return a scan path's timestamp and the new mod entries in it.
+
+    If our path's timestamp is still 'last_mtime', we skip
+    reading it; entries in 'known_paths' are skipped too.
+    """
+    if not path.is_dir():
+        return None, []
+
+    # A folder's timestamp changes as things get added into or
+    # removed from it; if it didn't, we've got nothing new here.
+    # (changes inside our mods are checked in 'read_mod_entries'.)
+    mtime = path.stat().st_mtime_ns
+    if mtime == last_mtime:
+        return mtime, []
+
+    found: list[ModEntry] = []
+    with os.scandir(path) as it:
+        for dirent in it:
+            if dirent.path in known_paths:
+                continue
+
+            entry: ModEntry | None = None
+
+            if dirent.is_dir():
+                # possibly an uncompressed mod.
+                entry = ModEntry(Path(dirent.path), type=ModEntryType.FOLDER)
+
+            elif dirent.is_file():
+                ext = os.path.splitext(dirent.name)[1]
+                entry_type = MOD_FILE_TYPES.get(ext)
+                if entry_type is not None:
+                    entry = ModEntry(Path(dirent.path), type=entry_type)
+                else:
+                    _log().debug('no assignable filetype: "%s"', dirent.path)
+
+            if entry is not None:
+                found.append(entry)
+
+    return mtime, found
+
+
+def _scan_mod_paths(
+    paths: list[Path],
+    path_mtimes: dict[Path, int],
+    known: dict[Path, ModEntry],
+    pool: Executor | None = None,
+) -> list[ModEntry]:
+    """Return new mod entries found in our scan paths.
+
+    Paths that haven't changed since their 'path_mtimes'
+    entry are skipped; their entries get updated otherwise.
+    Files already in 'known' are skipped too.
+    If provided a 'pool', paths are scanned side by side.
+    """
+    known_paths = {str(p) for p in known}
+    last_mtimes = [path_mtimes.get(path) for path in paths]
+    known_sets = [known_paths] * len(paths)
+    # Our paths could each live in a different (slow) drive,
+    # so there's no need to wait on one before reading the next.
+    results = (
+        pool.map(_scan_mod_path, paths, last_mtimes, known_sets)
+        if pool is not None and len(paths) > 1
+        else map(_scan_mod_path, paths, last_mtimes, known_sets)
+    )
+
+    found: list[ModEntry] = []
+    for path, (mtime, entries) in zip(paths, results):
+        if mtime is not None:
+            path_mtimes[path] = mtime
+        found.extend(entries)
+    return found
+
+
+def _get_mod_entry_hashes(
+    entries: Iterable[ModEntry],
+) -> dict[ModEntry, str | None]:
+    """Return our entries' filetree hashes, 'None' for missing ones."""
+    hashes: dict[ModEntry, str | None] = {}
+    for entry in entries:
+        try:
+            hashes[entry] = entry.get_filetree_time_hash()
+        except OSError:
+            hashes[entry] = None
+    return hashes
 
-        if self.path.is_dir():
-            # walk through folders and check if any
-            # files have had their timestamps updated
-            # (which usually means they changed)
-            for p, _, fl in os.walk(self.path):
-                for f in sorted(fl):
-                    try:
-                        file = Path(os.path.join(p, f))
-                        hasher.update(f"{file.stat().st_mtime_ns}".encode())
-                    except OSError:
-                        continue
-        else:
-            hasher.update(f"{self.path.stat().st_mtime_ns}".encode())
 
-        return hasher.hexdigest()
+@dataclass
+class _ModScan:
+    """Results of a mod scan, ready to be applied."""
+
+    path_mtimes: dict[Path, int]
+    entries: list[ModEntry]
+    hashes: dict[ModEntry, str | None]
+
+
+_ScanArgs = tuple[
+    list[Path], dict[Path, int], dict[Path, ModEntry], tuple[ModEntry, ...]
+]
+"""Arguments '_scan_mods' takes, in order."""
+
+
+def _scan_mods(
+    paths: list[Path],
+    path_mtimes: dict[Path, int],
+    known: dict[Path, ModEntry],
+    watched: tuple[ModEntry, ...],
+    pool: Executor | None = None,
+) -> _ModScan:
+    """Do all filesystem work of a mod scan.
+
+    This runs on our worker thread, so it only
+    touches the copies of our state it's given.
+    """
+    entries = _scan_mod_paths(paths, path_mtimes, known, pool)
+    return _ModScan(
+        path_mtimes=path_mtimes,
+        entries=entries,
+        hashes=_get_mod_entry_hashes((*watched, *entries)),
+    )
 
 
 class ModLoaderSubsystem(AppSubsystem):
@@ -105,13 +282,27 @@ class ModLoaderSubsystem(AppSubsystem):
 
     def __init__(self) -> None:
         self._mod_path_set: set[Path] = set()
+        self._added_sys_paths: set[str] = set()
+        """Mod folders we've added to 'sys.path' already."""
         self._mod_entries: set[ModEntry] = set()
+        """Entries we keep checking for changes."""
+        self._stable_entries: set[ModEntry] = set()
+        """Entries that only load once and already did so."""
+        self._entries_by_path: dict[Path, ModEntry] = {}
         self._mod_entry_hashes: dict[ModEntry, str] = {}
+        self._scan_path_mtimes: dict[Path, int] = {}
+        """Scan path folder timestamps as of our last look inside them."""
         self.paths_to_scan: list[Path] = MOD_PATHS
         # we don't want vanilla to load our plugins...
         # bs.app.plugins._load_plugins = lambda: None
 
         self._scan_timer: bs.AppTimer | None = None
+        # Keep our filesystem crawling off the logic thread.
+        # (a scan takes up one worker and hands paths to the rest.)
+        self._io_pool = ThreadPoolExecutor(
+            max_workers=4, thread_name_prefix="modscan"
+        )
+        self._pending_scan: Future[_ModScan] | None = None
 
         # make sure these exist before we start our jobs
         os.makedirs(get_mods_resource_folder("textures"), exist_ok=True)
@@ -120,12 +311,18 @@ class ModLoaderSubsystem(AppSubsystem):
 
     @override
     def on_app_running(self) -> None:
-        self.scan_for_mods()
+        # Get our first batch of mods in right away.
+        self._apply_scan(_scan_mods(*self._get_scan_args(), self._io_pool))
         # TODO: We could make the time dynamic depending on the activity;
         #       we'd check for changes faster while in the main menu or paused,
         #       while checking sporadically when actively playing.
         self._scan_timer = bs.AppTimer(0.25, self.scan_for_mods, repeat=True)
 
+    @override
+    def on_app_shutdown(self) -> None:
+        self._scan_timer = None
+        self._io_pool.shutdown(wait=False, cancel_futures=True)
+
     def add_scan_path(self, path: str) -> None:
         """Add a path to our paths to scan our mods at."""
         if not os.path.exists(path):
@@ -136,69 +333,74 @@ class ModLoaderSubsystem(AppSubsystem):
         self.paths_to_scan.append(Path(path))
 
     def scan_for_mods(self) -> None:
-        """Scan our paths and register new mods."""
+        """Scan our paths and register new mods.
 
-        for path in self.paths_to_scan:
+        Filesystem work runs on our worker thread; its results
+        get applied on the next call after it's done.
+        """
+        future = self._pending_scan
+        if future is not None:
+            if not future.done():
+                return
+            self._pending_scan = None
+            try:
+                self._apply_scan(future.result())
+            except Exception:
+                _log().exception("mod scan failed")
+
+        self._pending_scan = self._io_pool.submit(
+            _scan_mods, *self._get_scan_args(), self._io_pool
+        )
 
-            if not path.exists() or not path.is_dir():
-                continue
+    def _get_scan_args(self) -> _ScanArgs:
+        """Return copies of our state for '_scan_mods' to work on."""
+        return (
+            list(self.paths_to_scan),
+            dict(self._scan_path_mtimes),
+            dict(self._entries_by_path),
+            tuple(self._mod_entries),
+        )
 
-            for file in os.listdir(path):
-                # TODO: optimize this; prevent ourselves from
-                # reading the same paths over and over again.
-                filepath = Path(os.path.join(path, file))
-
-                entry: ModEntry | None = None
-
-                if filepath.is_dir():
-                    # possibly an uncompressed mod.
-                    entry = ModEntry(filepath, type=ModEntryType.FOLDER)
-
-                elif filepath.is_file():
-                    ext = filepath.suffix
-                    match ext:
-                        case ".py":
-                            entry = ModEntry(filepath, type=ModEntryType.PLUGIN)
-                        # TODO: '.bsmod' compressed mods will have their own
-                        # file structure and we want to compensate for that...
-                        case ".bsmod":
-                            entry = ModEntry(filepath, type=ModEntryType.PACKED)
-                        case ".zip" | ".rar":
-                            entry = ModEntry(
-                                filepath, type=ModEntryType.COMPRESSED
-                            )
-                        case _:
-                            _log().debug(
-                                'no assignable filetype: "%s"', filepath
-                            )
-
-                if entry is not None:
-                    self._mod_entries.add(entry)
-
-        self.read_mod_entries()
-
-    def read_mod_entries(self) -> None:
+    def _apply_scan(self, scan: _ModScan) -> None:
+        """Register and (re)load mods out of a finished scan."""
+        self._scan_path_mtimes = scan.path_mtimes
+        for entry in scan.entries:
+            self._entries_by_path[entry.path] = entry
+            self._mod_entries.add(entry)
+        self.read_mod_entries(scan.hashes)
+
+    def read_mod_entries(
+        self, hashes: dict[ModEntry, str | None] | None = None
+    ) -> None:
         """Read all entries from our 'self._mod_entries' set.
 
         We run this function repeatedly to check if any of our
         already registered mods have been changed.
+        'hashes' can provide already fetched filetree hashes;
+        entries missing from it are left for later.
         """
-        for entry in self._mod_entries.copy():
+        if hashes is None:
+            hashes = _get_mod_entry_hashes(self._mod_entries)
+
+        # We go through 'hashes' so we're free to modify our sets.
+        for entry, newhash in hashes.items():
+            if entry not in self._mod_entries:
+                continue
 
-            if not entry.path.exists():
+            if newhash is None:
 
                 self._mod_entries.remove(entry)
+                self._entries_by_path.pop(entry.path, None)
                 continue
 
             lasthash = self._mod_entry_hashes.setdefault(entry, "")
             first_update = not lasthash
-            newhash = entry.get_filetree_time_hash()
-            updateable = entry.type in [
-                ModEntryType.PLUGIN,
-                ModEntryType.FOLDER,
-            ]
+            updateable = entry.type in UPDATEABLE_MOD_TYPES
+            if not updateable:
+                # We only load these once, so stop checking them.
+                self._mod_entries.remove(entry)
+                self._stable_entries.add(entry)
             if (  # check periodically for updateables, once for nons.
-                # FIXME: it shouldn't be like this? only LOAD nons once.
                 (lasthash != newhash and updateable)
                 or (not updateable and first_update)
             ):
@@ -254,18 +456,21 @@ class ModLoaderSubsystem(AppSubsystem):
             textures_path,
             get_mods_resource_folder("textures"),
             hashname,
-            [".png", ".dds", ".ktx"],
+            TEXTURE_FILETYPES,
         )
         # TODO: convert .mp3 files, maybe?
         self._migrate_files(
-            audio_path, get_mods_resource_folder("audio"), hashname, [".ogg"]
+            audio_path,
+            get_mods_resource_folder("audio"),
+            hashname,
+            AUDIO_FILETYPES,
         )
         # TODO: convert .glb files, maybe?
         self._migrate_files(
             meshes_path,
             get_mods_resource_folder("meshes"),
             hashname,
-            [".bob", ".cob"],
+            MESH_FILETYPES,
         )
 
         if (
@@ -273,9 +478,12 @@ class ModLoaderSubsystem(AppSubsystem):
             and main_script_path.is_file()
             and main_script_path.suffix == ".py"
         ):
-            # FIXME: We don't want to be doing ANY of this repeatedly.
-            # 'sys.path.append'ing the same path... importing multiple times...
-            sys.path.append(str(folder_path))
+            # FIXME: We don't want to be importing multiple times...
+            # (at least we only add our folder to 'sys.path' once.)
+            syspath = str(folder_path)
+            if syspath not in self._added_sys_paths:
+                self._added_sys_paths.add(syspath)
+                sys.path.append(syspath)
             ext = main_script_path.suffix
             filename = main_script_path.name[: -len(ext)]
             if first_update:
@@ -296,28 +504,35 @@ class ModLoaderSubsystem(AppSubsystem):
         bui.getsound(sfx).play()
 
     def _get_manifest_data(self, path: Path) -> Any | None:
-        manifest_path = Path(os.path.join(path, "manifest.json"))
-
-        if manifest_path.exists() and manifest_path.is_file():
-            with open(manifest_path, encoding="utf-8") as f:
-                try:
-                    return json.loads(f.read())
-                except json.JSONDecodeError:
-                    _log().warning(
-                        'erroneous manifest at "%s"',
-                        manifest_path,
-                        exc_info=True,
-                    )
+        manifest_path = os.path.join(path, "manifest.json")
+
+        # Just try opening it; that's one syscall instead of three
+        # if we checked whether it exists and is a file beforehand.
+        try:
+            with open(manifest_path, "rb") as f:
+                data = f.read()
+        except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+            return None
+
+        try:
+            return json.loads(data)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            _log().warning(
+                'erroneous manifest at "%s"',
+                manifest_path,
+                exc_info=True,
+            )
+        return None
 
     def _migrate_files(
         self,
         source: Path,
         destination: Path,
         hashname: str,
-        allowed_filetypes: list[str] | None = None,
+        allowed_filetypes: frozenset[str] | None = None,
     ):
         if allowed_filetypes is None:
-            allowed_filetypes = []
+            allowed_filetypes = frozenset()
 
         if source.exists():
             to_path = self._get_abspath(
@@ -325,16 +540,24 @@ class ModLoaderSubsystem(AppSubsystem):
                 destination,
             )
             os.makedirs(to_path, exist_ok=True)
-            for filename in os.listdir(source):
-                filepath = self._get_abspath(filename, source)
-                if filepath.suffix in allowed_filetypes:
-                    shutil.copy(filepath, to_path)
+            with os.scandir(source) as it:
+                for entry in it:
+                    if (
+                        os.path.splitext(entry.name)[1] in allowed_filetypes
+                        and entry.is_file()
+                    ):
+                        # 'copyfile' goes straight for the OS' fast copy
+                        # calls; we don't need our permission bits copied.
+                        shutil.copyfile(entry.path, to_path / entry.name)
 
     def _generate_mod_name_hash(self, metadata: dict) -> str:
         n, a = metadata["name"], metadata["author"]
         encoded_title = f"{n}&{a}".encode()
 
-        return hashlib.sha256(encoded_title).hexdigest()
+        # Only used to name our asset folders; no need for anything heavier.
+        return hashlib.blake2b(encoded_title, digest_size=16).hexdigest()
 
     def _get_abspath(self, rel: str | Path, main: str | Path) -> Path:
-        return Path(os.path.join(main, rel)).absolute()
+        path = Path(main, rel)
+        # 'absolute' asks for our working dir; skip it if we can.
+        return path if path.is_absolute() else path.absolute()
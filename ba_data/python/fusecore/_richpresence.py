@@ -0,0 +1,232 @@
+"""Discord Rich Presence status types and the thread that sends them."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import threading
+import queue
+import logging
+from enum import Enum
+from typing import Any, Callable
+
+import babase
+import bascenev1 as bs
+
+from fusecore.libs.discordrp import Presence, ClientIDError
+
+FATAL_EXC: tuple[type[Exception], ...] = (
+    PermissionError,
+    ClientIDError,
+)
+"""Errors that retrying won't fix, such as an invalid client id.
+
+A missing IPC socket ('FileNotFoundError') just means Discord isn't
+running (yet), so that one is left to our regular retry attempts.
+"""
+
+_LOG = logging.getLogger(__name__)
+
+
+class RPStatusType(Enum):
+    """Rich Presence state type.
+    This type is related to how our Rich Presence is
+    displayed on discord.
+
+    e.g. 'RPStatusType.PLAYING' will display "Playing BombSquad"
+    while 'RPStatusType.WATCHING' will show "Watching BombSquad"
+
+    NOTE: Status type 'WATCHING' is hardcoded and does not work!
+    """
+
+    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-types
+    PLAYING = 0
+    STREAMING = 1
+    LISTENING = 2
+    WATCHING = 3
+    CUSTOM = 4
+    COMPETING = 5
+
+
+class RPDisplayType(Enum):
+    # https://discord.com/developers/docs/events/gateway-events#activity-object-status-display-types
+    NAME = 0
+    STATE = 1
+    DETAILS = 2
+
+
+@dataclass
+class RPTimestamps:
+    """Rich Presence timestamps collection."""
+
+    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-timestamps
+    start: int
+    end: int
+
+    def to_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "end": self.end,
+        }
+
+
+@dataclass
+class RPEmoji:
+    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-emoji
+    # FIXME: is this even needed in this context?
+    name: str
+    id: str = ""
+    animated: bool = False
+
+
+@dataclass
+class RichPresenceStatus:
+    """Discord Activity Status."""
+
+    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-structure
+    name: str
+    type: RPStatusType
+    created_at: int
+
+    url = None
+    """Used for streams, goes unused here."""
+    timestamps: RPTimestamps | None = None
+    """Start and end times of our activity, displayed as a timer."""
+    application_id: str = ""
+    status_display_type: RPDisplayType = RPDisplayType.NAME
+
+    details: str = ""
+    details_url: str = ""
+    state: str = ""
+    state_url: str = ""
+
+    # FIXME: is this even needed in this context?
+    emoji: RPEmoji | None = None
+
+    # TODO: implement me!
+    party = None
+    assets = None
+    secrets = None
+    instance = None
+    flags = None
+    buttons = None
+
+
+class ThreadState(Enum):
+    INACTIVE = 0
+    ACTIVE = 1
+    STOPPED = -1
+
+
+class RichPresenceThread(threading.Thread):
+    def __init__(
+        self,
+        client_id: str,
+        on_state_change: Callable[[RichPresenceThread], Any] | None = None,
+        initial_data: dict | None = None,
+    ):
+        """Create a thread to dynamically change
+        our Discord Rich Presence status between activities.
+
+        'on_state_change' is pushed to the logic thread with this
+        thread as its argument whenever we become active or stop.
+        'initial_data' is set as our status as soon as we connect.
+        """
+        super().__init__()
+        self.client_id = client_id
+        self._initial_data = initial_data
+        self.presence: Presence | None = None
+        self.status: ThreadState = ThreadState.INACTIVE
+        self._should_stop = threading.Event()
+        self._on_state_change = on_state_change
+        self.fatal: bool = False
+        """Did we stop due to an error that retrying won't fix?"""
+        self._queue: queue.Queue[dict | None] = queue.Queue(maxsize=1)
+        """Latest status waiting to be sent by us ('None' just wakes us.)"""
+
+    def _set_status(self, status: ThreadState) -> None:
+        """Set our status and let our subsystem know about it."""
+        self.status = status
+
+        if self._on_state_change is not None:
+            babase.pushcall(
+                bs.CallPartial(self._on_state_change, self),
+                from_other_thread=True,
+            )
+
+    def _handle_error(self, exc: Exception) -> None:
+        """Handle not being able to send a Rich Presence request."""
+        # Flag it before letting our subsystem know we stopped
+        # so it doesn't bother retrying.
+        self.fatal = isinstance(exc, FATAL_EXC)
+        self._set_status(ThreadState.STOPPED)
+        # If we OSError, we probably lost connection.
+        # Don't make a fuss about it.
+        if isinstance(exc, OSError) and not self.fatal:
+            return
+        _LOG.error(
+            "Something wrong occurred while handling a rich presence request."
+            "\nThreadState: %s",
+            self.status,
+            exc_info=exc,
+        )
+
+    def _start_presence(self) -> None:
+        """Try executing our presence."""
+        # Start running and mantain our presence.
+        try:
+            _LOG.info("Starting 'RichPresenceThread'...")
+            with Presence(self.client_id) as presence:
+                self.presence = presence
+                if self._initial_data is not None:
+                    presence.set(self._initial_data)
+                _LOG.info(
+                    "'RichPresenceThread' started successfully!\n"
+                    "Waiting for our DiscordRPSubsystem to link..."
+                )
+                self._set_status(ThreadState.ACTIVE)
+                # Keep it running and send whatever status we're handed
+                # until we're asked to stop, keeping IPC off the logic thread.
+                while not self._should_stop.is_set():
+                    data = self._queue.get()
+                    if data is not None:
+                        presence.set(data)
+                self._set_status(ThreadState.STOPPED)
+                _LOG.info("'RichPresenceThread' stopped.")
+
+        except Exception as e:
+            self._handle_error(e)
+
+    def set(self, data: dict) -> None:
+        """Set our presence."""
+        # https://discord.com/developers/docs/topics/gateway-events#activity-object-activity-structure
+        if self.presence is None:
+            _LOG.warning(
+                "No DiscordRPSubsystem linked while tying to set presence status?",
+                stack_info=True,
+            )
+            return
+
+        _LOG.info("Set our Discord Presence Status.\nProvided: %s", data)
+        self._offer(data)
+
+    def _offer(self, data: dict | None) -> None:
+        """Hand data over to our loop, replacing anything still waiting.
+
+        Only the latest status matters, so there's no point queueing more.
+        """
+        try:
+            self._queue.put_nowait(data)
+        except queue.Full:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                pass
+            self._queue.put_nowait(data)
+
+    def stop(self) -> None:
+        """Stop our presence."""
+        self._should_stop.set()
+        self._offer(None)
+
+    def run(self):
+        self._start_presence()
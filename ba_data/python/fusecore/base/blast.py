@@ -115,7 +115,7 @@ class Blast(FactoryActor):
         # explosion attrs.
         self.magnitude: int = 2000
         self.materials: tuple[bs.Material, ...] = (
-            self.factory.fetch("blast_material"),
+            self.factory.blast_material,
             self.shared.attack_material,
         )
         # blast attrs.
@@ -240,7 +240,7 @@ class Blast(FactoryActor):
     def do_sounds(self) -> None:
         """Play some sounds."""
         self.factory.random_explode_sound().play(position=self.position)
-        self.factory.fetch("debris_fall_sound").play(position=self.position)
+        self.factory.debris_fall_sound.play(position=self.position)
 
     def do_emit(self) -> None:
         """Play some particle related functions."""
@@ -419,7 +419,7 @@ class IceBlast(Blast):
     def do_sounds(self) -> None:
         """Play an extra hiss sound."""
         super().do_sounds()
-        self.factory.fetch("hiss_sound").play(position=self.position)
+        self.factory.hiss_sound.play(position=self.position)
 
     def do_effects(self) -> None:
         """Do our tendrils & distortion effects."""
@@ -466,7 +466,7 @@ class IceBlast(Blast):
         # Do standard behavior
         super().handle_explode_hit()
         # Then kick 'em with a freeze!
-        self.factory.fetch("freeze_sound").play(10, position=self.node.position)
+        self.factory.freeze_sound.play(10, position=self.node.position)
         node = bs.getcollision().opposingnode
         node.handlemessage(bs.FreezeMessage())
 
@@ -577,8 +577,8 @@ class TNTBlast(Blast):
             self.factory.random_explode_sound().play(position=self.position)
 
         def extra_debris() -> None:
-            self.factory.fetch("debris_fall_sound").play(position=self.position)
-            self.factory.fetch("wood_debris_fall_sound").play(
+            self.factory.debris_fall_sound.play(position=self.position)
+            self.factory.wood_debris_fall_sound.play(
                 position=self.position
             )
 
@@ -216,8 +216,8 @@ class Bomb(FactoryActor):
 
     def attributes(self) -> None:
         """Define base attributes."""
-        self.mesh: bs.Mesh = self.factory.fetch("bomb_mesh")
-        self.tex: bs.Texture = self.factory.fetch("bomb_tex")
+        self.mesh: bs.Mesh = self.factory.bomb_mesh
+        self.tex: bs.Texture = self.factory.bomb_tex
         self.light_mesh: bs.Mesh | bool = False
 
         self.body: str | None = None
@@ -228,8 +228,8 @@ class Bomb(FactoryActor):
         self.shadow_size: float = 0.3
 
         self.materials: tuple[bs.Material, ...] = (
-            self.factory.fetch("bomb_material"),
-            self.factory.fetch("normal_sound_material"),
+            self.factory.bomb_material,
+            self.factory.normal_sound_material,
             self.shared.object_material,
         )
         self.sticky: bool = False
@@ -239,7 +239,7 @@ class Bomb(FactoryActor):
         # to run a node with a "prop" type will warn the user that
         # the engine doesn't really work like that.
         self.visible_fuse: bool | int = 1
-        self.fuse_sound: bs.Sound | None = self.factory.fetch("fuse_sound")
+        self.fuse_sound: bs.Sound | None = self.factory.fuse_sound
         self.fuse_time: float | None = 3.0
         self.blast_class: Type[Blast] = Blast
 
@@ -431,14 +431,14 @@ class StickyBomb(Bomb):
         # Load default attributes
         super().attributes()
         # Set our own
-        self.mesh: bs.Mesh = self.factory.fetch("sticky_bomb_mesh")
-        self.tex: bs.Texture = self.factory.fetch("sticky_tex")
+        self.mesh: bs.Mesh = self.factory.sticky_bomb_mesh
+        self.tex: bs.Texture = self.factory.sticky_tex
 
         self.sticky = True
 
         self.materials: tuple = (
-            self.factory.fetch("bomb_material"),
-            self.factory.fetch("sticky_material"),
+            self.factory.bomb_material,
+            self.factory.sticky_material,
             self.shared.object_material,
         )
         self.blast_class = StickyBlast
@@ -465,7 +465,7 @@ class StickyBomb(Bomb):
         ):
             self._last_sticky_sound_time = bs.time()
             assert self.node
-            self.factory.fetch("sticky_impact_sound").play(
+            self.factory.sticky_impact_sound.play(
                 2.0,
                 position=self.node.position,
             )
@@ -498,7 +498,7 @@ class IceBomb(Bomb):
         # Load default attributes
         super().attributes()
         # Set our own
-        self.tex = self.factory.fetch("ice_tex")
+        self.tex = self.factory.ice_tex
 
         self.blast_class = IceBlast
 
@@ -527,9 +527,9 @@ class ImpactBomb(Bomb):
         # Load default attributes
         super().attributes()
         # Set our own
-        self.tex_off: bs.Texture = self.factory.fetch("impact_tex")
-        self.tex_on: bs.Texture = self.factory.fetch("impact_lit_tex")
-        self.mesh = self.factory.fetch("impact_bomb_mesh")
+        self.tex_off: bs.Texture = self.factory.impact_tex
+        self.tex_on: bs.Texture = self.factory.impact_lit_tex
+        self.mesh = self.factory.impact_bomb_mesh
         self.tex = self.tex_off
 
         self.body = "sphere"
@@ -546,8 +546,8 @@ class ImpactBomb(Bomb):
         self.impact_timers: bool = True
         self.arm_timer: bs.Timer
         self.warn_timer: bs.Timer
-        self.warn_sound: bs.Sound = self.factory.fetch("warn_sound")
-        self.activate_sound: bs.Sound = self.factory.fetch("activate_sound")
+        self.warn_sound: bs.Sound = self.factory.warn_sound
+        self.activate_sound: bs.Sound = self.factory.activate_sound
         self.texture_sequence: bs.Node | None = None
 
     def create_bomb(self) -> None:
@@ -587,7 +587,7 @@ class ImpactBomb(Bomb):
             0.25,
             bs.WeakCallPartial(
                 self.add_material,
-                self.factory.fetch("land_mine_blast_material"),
+                self.factory.land_mine_blast_material,
             ),
         )
         self.texture_sequence.connectattr(  # type: ignore
@@ -672,9 +672,9 @@ class LandMine(ImpactBomb):
         # Load default attributes
         super().attributes()
         # Set our own
-        self.tex_off = self.factory.fetch("land_mine_tex")
-        self.tex_on = self.factory.fetch("land_mine_lit_tex")
-        self.mesh = self.factory.fetch("land_mine_mesh")
+        self.tex_off = self.factory.land_mine_tex
+        self.tex_on = self.factory.land_mine_lit_tex
+        self.mesh = self.factory.land_mine_mesh
         self.tex = self.tex_off
         self.light_mesh = True
 
@@ -683,8 +683,8 @@ class LandMine(ImpactBomb):
         self.shadow_size = 0.44
 
         self.materials = (
-            self.factory.fetch("bomb_material"),
-            self.factory.fetch("land_mine_no_explode_material"),
+            self.factory.bomb_material,
+            self.factory.land_mine_no_explode_material,
             self.shared.object_material,
         )
         self.blast_class = LandMineBlast
@@ -717,7 +717,7 @@ class LandMine(ImpactBomb):
             0.25,
             bs.WeakCallPartial(
                 self.add_material,
-                self.factory.fetch("land_mine_blast_material"),
+                self.factory.land_mine_blast_material,
             ),
         )
         self.texture_sequence.connectattr(  # type: ignore # intellisense issue
@@ -761,8 +761,8 @@ class TNT(Bomb):
         # Load default attributes
         super().attributes()
         # Set our own
-        self.mesh = self.factory.fetch("tnt_mesh")
-        self.tex = self.factory.fetch("tnt_tex")
+        self.mesh = self.factory.tnt_mesh
+        self.tex = self.factory.tnt_tex
         self.light_mesh = True
 
         self.body = "crate"
@@ -771,7 +771,7 @@ class TNT(Bomb):
         self.shadow_size = 0.5
 
         self.materials = (
-            self.factory.fetch("bomb_material"),
+            self.factory.bomb_material,
             self.shared.footing_material,
             self.shared.object_material,
         )
@@ -163,14 +163,14 @@ class Factory:
         # are to be processed before returning their pointer.
         return res.get()
 
-    def fetch(self, name: str) -> Any:
-        """Get a resource from this factory."""
-        v: Empty | Any = getattr(self, name, Empty)
-        if v is Empty:  # fetched resource doesn't exist...
-            raise ValueError(f'"{name}" does not exist in "{self}".')
-
-        _log().debug('Fetching "%s" from "%s".', name, self)
-        return v
+    def __getattr__(self, name: str) -> Any:
+        """Called only when a resource lookup misses.
+
+        Resources are set as plain attributes in '__init__', so
+        successful lookups never reach this; we're only here to
+        provide a more descriptive error.
+        """
+        raise AttributeError(f'"{name}" does not exist in "{self}".')
 
 
 class FactoryClass:
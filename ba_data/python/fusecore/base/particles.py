@@ -2,18 +2,17 @@
 
 from __future__ import annotations
 
-from collections import OrderedDict
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Literal, Self, Type, override
+from typing import Any, Literal, Self, Sequence, Type, override
 
-import random
+from random import random as _random
 
 import bascenev1 as bs
 from bascenev1lib.gameutils import SharedObjects
 from bascenev1lib.mainmenu import MainMenuActivity
 
-from fusecore.common import vector3_multfactor
+from fusecore.common import vector3_multfactor_batch
 
 from .factory import (
     Factory,
@@ -77,6 +76,8 @@ class ParticleFactory(Factory):
         self.shared = SharedObjects.get()
 
         self.material = self.get_particle_material()
+        self.attribute_cache: dict[type[Particle], dict[str, Any]] = {}
+        """Attributes set by the first particle of each caching type."""
 
     def get_particle_material(
         self,
@@ -121,7 +122,8 @@ class ParticleDirector:
     IDENTIFIER = "_particle_director"
 
     def __init__(self) -> None:
-        self._particle_pool: OrderedDict[int, Particle] = OrderedDict()
+        self._particle_pool: dict[int, Particle] = {}
+        """Our particles by ID; oldest first as IDs only go up."""
         self._inum: int = 0
 
         self.limit_mode: ParticleLimitMode = ParticleLimitMode.OVERWRITE
@@ -156,8 +158,7 @@ class ParticleDirector:
                     return False
                 case ParticleLimitMode.OVERWRITE:
                     # order oldest to die and remove
-                    _, particle = self._particle_pool.popitem(last=False)
-                    particle.handlemessage(DirectorKillMessage())
+                    self._pop_oldest().handlemessage(DirectorKillMessage())
 
         self._inum += 1
 
@@ -166,12 +167,47 @@ class ParticleDirector:
         )
         return True
 
+    def perform_batch(
+        self,
+        particle_type: Type[Particle],
+        positions: Sequence[tuple[float, float, float]],
+        velocities: Sequence[tuple[float, float, float]],
+    ) -> int:
+        """Ask the director to spawn a batch of particles
+        with their respective positions & velocities.
+
+        Works like 'perform', but we check our limit once
+        for the whole batch. Returns how many we spawned.
+        """
+        pool = self._particle_pool
+        count = min(len(positions), len(velocities))
+        free = self.particle_limit - len(pool)
+        if count > free:
+            match self.limit_mode:
+                case ParticleLimitMode.DISMISS:
+                    count = max(free, 0)
+                case ParticleLimitMode.OVERWRITE:
+                    # no point in spawning what we'd kill right away.
+                    count = min(count, self.particle_limit)
+                    # order oldest to die and remove
+                    for _ in range(min(count - free, len(pool))):
+                        self._pop_oldest().handlemessage(DirectorKillMessage())
+
+        for i in range(count):
+            self._inum += 1
+            pool[self._inum] = particle_type(
+                positions[i], velocities[i], self._inum
+            )
+        return count
+
+    def _pop_oldest(self) -> Particle:
+        """Remove and return our oldest particle."""
+        # Plain dicts keep insertion order, so our first key is our oldest.
+        return self._particle_pool.pop(next(iter(self._particle_pool)))
+
     def remove_particle(self, did: int) -> None:
         """Removes a particle from our particle pool using their ID."""
-        try:
-            self._particle_pool.pop(did)
-        except KeyError:
-            pass
+        self._particle_pool.pop(did, None)
 
     @classmethod
     def instance(cls) -> Self:
@@ -181,14 +217,27 @@ class ParticleDirector:
         return an already active object if it has been created already.
         """
         activity: bs.Activity = bs.getactivity()
-        factory = activity.customdata.get(cls.IDENTIFIER)
+        # We get asked for a lot, so we also live as an attribute in
+        # our activity to skip going through its 'customdata' dict.
+        factory = getattr(activity, cls.IDENTIFIER, None)
         if factory is None:
-            factory = cls()
-            activity.customdata[cls.IDENTIFIER] = factory
+            factory = activity.customdata.get(cls.IDENTIFIER)
+            if factory is None:
+                factory = cls()
+                activity.customdata[cls.IDENTIFIER] = factory
+            setattr(activity, cls.IDENTIFIER, factory)
         assert isinstance(factory, cls)
         return factory
 
 
+def _copy_attributes(attrs: dict[str, Any]) -> dict[str, Any]:
+    """Copy mutable attribute values so particles don't share them."""
+    return {
+        k: v.copy() if isinstance(v, (list, dict, set)) else v
+        for k, v in attrs.items()
+    }
+
+
 class Particle(FactoryActor):
     """A particle actor to add *custom* sass to in-game actions.
 
@@ -202,6 +251,17 @@ class Particle(FactoryActor):
     my_factory = ParticleFactory
     group_set = PARTICLE_SET
 
+    cache_attributes: bool = True
+    """Do all instances of this particle share the same attributes?
+
+    If so, 'attributes' only runs for our first particle in each
+    activity and the rest copy what it set. Only enable this if your
+    particle sets the exact same attributes on every instance.
+
+    This only applies to the class that sets it; subclasses don't
+    inherit it and have to opt in themselves.
+    """
+
     @staticmethod
     def resources() -> dict:
         """Register resources used by this particle.
@@ -222,13 +282,13 @@ class Particle(FactoryActor):
     def attributes(self) -> None:
         """Define the attributes of this particle actor."""
         self.factory: ParticleFactory  # set via 'my_factory'
-        particle_material = self.factory.get_particle_material()
+        particle_material = self.factory.material
         # alternatively, you can do:
-        # 'material = self.factory.material'
-        # if you don't care about it having custom
-        # friction, dampingand stiffness qualities.
+        # 'material = self.factory.get_particle_material(...)'
+        # if you want it to have custom friction,
+        # damping and stiffness qualities.
 
-        self.mesh: bs.Mesh = self.factory.fetch("mesh")
+        self.mesh: bs.Mesh = self.factory.mesh
         self.light_mesh: bs.Mesh = self.mesh
         self.body: Literal[
             "landMine", "crate", "sphere", "box", "capsule", "puck"
@@ -236,7 +296,7 @@ class Particle(FactoryActor):
         self.body_scale: float = 1.0
         self.mesh_scale: float = 1.0
         self.shadow_size: float = 0.3
-        self.color_texture: bs.Texture = self.factory.fetch("tex")
+        self.color_texture: bs.Texture = self.factory.tex
         self.reflection: Literal["soft", "char", "powerup"] = "soft"
         self.reflection_scale: list[float] = [1.0]
         self.gravity_scale: float = 1.0
@@ -261,10 +321,33 @@ class Particle(FactoryActor):
         self._animation_node: bs.Node | None = None
         self._death_timer: bs.Timer | None = None
 
-        self.attributes()
+        # Reuse what 'attributes' set for a previous particle if we can.
+        cache = self._get_attribute_cache()
+        cached = None if cache is None else cache.get(type(self))
+        if cached is not None:
+            self.__dict__.update(_copy_attributes(cached))
+        else:
+            before = set(self.__dict__)
+            self.attributes()
+            if cache is not None:
+                cache[type(self)] = _copy_attributes(
+                    {k: v for k, v in self.__dict__.items() if k not in before}
+                )
 
         self._initialize(position, velocity)
 
+    def _get_attribute_cache(
+        self,
+    ) -> dict[type[Particle], dict[str, Any]] | None:
+        """Return our factory's attribute cache if our class opted in."""
+        if not type(self).__dict__.get("cache_attributes", False):
+            return None
+        # Kept in our factory so it goes away along with our activity.
+        factory = self.factory
+        if not isinstance(factory, ParticleFactory):
+            return None
+        return factory.attribute_cache
+
     def _initialize(
         self,
         position: tuple[float, float, float],
@@ -389,23 +472,27 @@ class Particle(FactoryActor):
         position_spread: float = 2.0
         velocity_spread: float = 1.25
 
-        for _ in range(7):
-            # add some randomness to our position and
-            # velocity to get some visual variety going
-            # TODO: implement 'vector3_spread' from 'core/common.py'
-            #       over whatever this sludge of code is
+        # random velocity multipliers for all our particles
+        velocities = vector3_multfactor_batch(
+            (velocity,) * 7,
+            factor_min=1.0 / velocity_spread,
+            factor_max=1.0 * velocity_spread,
+        )
 
-            p = (
-                position[0] + (position_spread * random.uniform(-1, 1)),
-                position[1] + (position_spread * random.uniform(-1, 1)),
-                position[2] + (position_spread * random.uniform(-1, 1)),
-            )
-            v = vector3_multfactor(
-                velocity,  # random velocity multiplier
-                factor_min=1.0 / velocity_spread,
-                factor_max=1.0 * velocity_spread,
+        # add some randomness to our position and
+        # velocity to get some visual variety going
+        rand = _random
+        x, y, z = position
+        # 'random() * 2 - 1' is 'uniform(-1, 1)' without the overhead.
+        positions = [
+            (
+                x + position_spread * (rand() * 2 - 1),
+                y + position_spread * (rand() * 2 - 1),
+                z + position_spread * (rand() * 2 - 1),
             )
-            director.perform(cls, p, v)
+            for _ in velocities
+        ]
+        director.perform_batch(cls, positions, velocities)
 
 
 Particle.register()
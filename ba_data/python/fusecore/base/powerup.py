@@ -68,6 +68,9 @@ class SpazPowerup(FactoryClass):
     do this UNLESS the powerup doesn't use a slot (e.g. Shield, Curse.)
     """
 
+    _has_billboard_texture: bool = False
+    """Whether our texture is meant to be shown. Set on 'register()'."""
+
     @classmethod
     def _register_texture(cls) -> None:
         """Register our unique texture."""
@@ -79,6 +82,7 @@ class SpazPowerup(FactoryClass):
     def register(cls) -> None:
         # Load up our unique texture and continue
         cls._register_texture()
+        cls._has_billboard_texture = cls.texture_name != "empty"
         return super().register()
 
     @override
@@ -117,7 +121,9 @@ class SpazPowerup(FactoryClass):
 
     def get_texture(self) -> bs.Texture:
         """Return the factory texture of this powerup."""
-        return self.factory.instance().fetch(self.texture_name)
+        # Our factory already keeps its loaded textures as plain
+        # attributes, so this is a single lookup on its instance.
+        return getattr(self.factory, self.texture_name)
 
 
 class TripleBombsPowerup(SpazPowerup):
@@ -259,9 +259,9 @@ class PowerupBox(FactoryActor):
 
     def attributes(self) -> None:
         """Define base variables and attributes."""
-        self.mesh: bs.Mesh = self.factory.fetch("mesh")
-        self.tex: bs.Texture = self.factory.fetch(f"{self.texture_name}")
-        self.light_mesh: bs.Mesh | bool = self.factory.fetch("mesh_simple")
+        self.mesh: bs.Mesh = self.factory.mesh
+        self.tex: bs.Texture = getattr(self.factory, self.texture_name)
+        self.light_mesh: bs.Mesh | bool = self.factory.mesh_simple
 
         self.body: str = "box"
         self.scale: float = 1.0
@@ -349,7 +349,7 @@ class PowerupBox(FactoryActor):
         assert self.node
         self.used = True
         # Play the sound and die
-        self.factory.fetch("powerup_sound").play(3, position=self.node.position)
+        self.factory.powerup_sound.play(3, position=self.node.position)
         self.handlemessage(bs.DieMessage())
 
     def handle_die(self, immediate: bool = False) -> None:
@@ -563,8 +563,8 @@ class Spaz(spaz.Spaz):
 
     def _orphan_powerup(self, powerup: SpazPowerup) -> None:
         """Equip a powerup that does not belong in any slot."""
-        if powerup.texture_name != "empty":
-            self._flash_billboard(bs.gettexture(powerup.texture_name))
+        if powerup._has_billboard_texture:  # pylint: disable=protected-access
+            self._flash_billboard(powerup.get_texture())
         self.node.handlemessage("flash")
         powerup.equip()
 
@@ -574,14 +574,13 @@ class Spaz(spaz.Spaz):
         if not 3 >= slot >= 1:  # node only have 3 slots
             return
 
-        tex_name: str = powerup.texture_name
         t_ms = int(bs.time() * 1000.0)
 
         # don't use 'setattr' unless it is absolutely necessary, kids.
         setattr(  # texture
             self.node,
             f"mini_billboard_{slot}_texture",
-            bs.gettexture(tex_name),
+            powerup.get_texture(),
         )
         setattr(  # initial time
             self.node,
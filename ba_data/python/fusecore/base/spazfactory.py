@@ -1,6 +1,7 @@
 """Defines our custom SpazFactory class."""
 
 from __future__ import annotations
+import functools
 from typing import TYPE_CHECKING, Type, override
 
 import bascenev1 as bs
@@ -15,6 +16,18 @@ VanillaSpazFactory: Type[spazfactory.SpazFactory] = obj_clone(
 
 if TYPE_CHECKING:
     from ..base.spaz import Spaz, SpazPowerup
+    from ..base.powerupbox import PowerupBoxFactory
+
+@functools.cache
+def _get_powerup_box_factory() -> Type[PowerupBoxFactory]:
+    """Return 'PowerupBoxFactory', importing it on first use.
+
+    Can't be imported at module level as it would be circular.
+    """
+    from fusecore.base.powerupbox import PowerupBoxFactory as _cls
+
+    return _cls
+
 
 # We're gonna commit a couple of crimes with these ones...
 # pylint: disable=protected-access
@@ -33,6 +46,12 @@ class SpazPowerupSlot:
         self.timer_warning: bs.Timer | None = None
         self.timer_wearoff: bs.Timer | None = None
 
+    def _ensure_alive(self) -> SpazPowerup | None:
+        """Return our active powerup if both it and our owner exist."""
+        if self.active_powerup is None or not self.owner.exists():
+            return None
+        return self.active_powerup
+
     def apply_powerup(self, powerup: SpazPowerup) -> None:
         """Give the spaz the provided powerup."""
         if not self.owner.exists():
@@ -50,56 +69,47 @@ class SpazPowerupSlot:
 
     def _do_powerup(self) -> None:
         """Arm this powerup's wearoff and unequip timers."""
-        if not self.active_powerup or not self.owner.exists():
+        pw = self._ensure_alive()
+        if pw is None:
             return
 
+        owner = self.owner
         self.timer_warning = bs.Timer(
-            max(
-                0,
-                (
-                    self.active_powerup.duration_ms
-                    - self.owner._powerup_wearoff_time_ms
-                )
-                / 1000,
-            ),
+            max(0, (pw.duration_ms - owner._powerup_wearoff_time_ms) / 1000),
             self._warn,
         )
-        self.timer_wearoff = bs.Timer(
-            self.active_powerup.duration_ms / 1000,
-            self._unequip,
-        )
-        if self.active_powerup.texture_name != "empty":
-            self.owner._flash_billboard(
-                bs.gettexture(self.active_powerup.texture_name)
-            )
+        self.timer_wearoff = bs.Timer(pw.duration_ms / 1000, self._unequip)
+        if pw._has_billboard_texture:
+            owner._flash_billboard(pw.get_texture())
 
     def _do_spaz_billboard_and_animate(self) -> None:
-        if not self.active_powerup or not self.owner.exists():
+        pw = self._ensure_alive()
+        if pw is None:
             return
 
-        self.owner.node.handlemessage("flash")
-        self.owner.powerup_billboard_slot(self.active_powerup)
+        owner = self.owner
+        owner.node.handlemessage("flash")
+        owner.powerup_billboard_slot(pw)
 
     def _warn(self) -> None:
-        if not self.active_powerup or not self.owner.exists():
+        pw = self._ensure_alive()
+        if pw is None:
             return
 
-        self.active_powerup.warning()
-        self.owner.powerup_warn(self.active_powerup.texture_name)
+        pw.warning()
+        self.owner.powerup_warn(pw.texture_name)
 
     def _unequip(self, overwrite: bool = False, clone: bool = False) -> None:
-        if not self.active_powerup or not self.owner.exists():
+        pw = self._ensure_alive()
+        if pw is None:
             return
 
-        from fusecore.base.powerupbox import (
-            PowerupBoxFactory,
-        )
-
-        self.owner.powerup_unwarn()
-        PowerupBoxFactory.instance().powerdown_sound.play(
-            position=self.owner.node.position,
+        owner = self.owner
+        owner.powerup_unwarn()
+        _get_powerup_box_factory().instance().powerdown_sound.play(
+            position=owner.node.position,
         )
-        self.active_powerup.unequip(overwrite=overwrite, clone=clone)
+        pw.unequip(overwrite=overwrite, clone=clone)
         self.active_powerup = None
         self.timer_warning = None
         self.timer_wearoff = None
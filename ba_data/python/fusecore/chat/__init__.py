@@ -9,6 +9,7 @@ import bascenev1 as bs
 import bauiv1 as bui
 
 CHAT_INTERCEPTS_SET: set[Type[ChatIntercept]] = set()
+CHAT_INTERCEPTS_INSTANCES: list[ChatIntercept] = []
 
 SENDER_OVERRIDE_DEFAULT: str = f"{bui.charstr(bui.SpecialChar.LOGO_FLAT)}"
 
@@ -18,8 +19,15 @@ class ChatIntercept:
 
     @classmethod
     def register(cls) -> None:
-        """Register this class into our intercepts set."""
+        """Register this class into our intercepts set.
+
+        Intercepts are stateless, so a single instance is created
+        here and reused for every message that goes through chat.
+        """
+        if cls in CHAT_INTERCEPTS_SET:
+            return
         CHAT_INTERCEPTS_SET.add(cls)
+        CHAT_INTERCEPTS_INSTANCES.append(cls())
 
     @abstractmethod
     def intercept(self, msg: str, client_id: int) -> bool:
@@ -31,8 +39,8 @@ def chat_message_intercept(msg: str, client_id: int) -> str | None:
     """Chat message function interception to read sent
     messages and run whatever functions and code we want.
     """
-    for intercept in CHAT_INTERCEPTS_SET:
-        if not intercept().intercept(msg, client_id):
+    for intercept in CHAT_INTERCEPTS_INSTANCES:
+        if not intercept.intercept(msg, client_id):
             return None
 
     return msg
@@ -62,7 +70,8 @@ def get_players_from_client_id(client_id: int) -> list[bs.Player]:
     player_list: list[bs.Player] = []
 
     for player in activity.players:
-        if player.sessionplayer.inputdevice.client_id == client_id:
+        inputdevice = player.sessionplayer.inputdevice
+        if inputdevice.client_id == client_id:
             player_list.append(player)
 
     return player_list
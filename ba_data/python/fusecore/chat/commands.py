@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Callable, Type, override
+from typing import Type, override
 import logging
 
 import bascenev1 as bs
@@ -16,7 +16,13 @@ from . import (
 
 COMMAND_ALTAS_CLIENT: set[Type[ChatCommand]] = set()
 COMMAND_ALTAS_SERVER: set[Type[ChatCommand]] = set()
-COMMAND_PREFIXES: list[str] = ["/"]
+CLIENT_CMD_INDEX: dict[str, Type[ChatCommand]] = {}
+SERVER_CMD_INDEX: dict[str, Type[ChatCommand]] = {}
+COMMAND_PREFIXES: tuple[str, ...] = ("/",)
+COMMAND_PREFIX_TABLE: tuple[tuple[str, int], ...] = tuple(
+    (p, len(p)) for p in COMMAND_PREFIXES
+)
+COMMAND_PREFIX_CHARS: frozenset[str] = frozenset(p[0] for p in COMMAND_PREFIXES)
 
 
 class CommandIntercept(ChatIntercept):
@@ -29,8 +35,12 @@ class CommandIntercept(ChatIntercept):
         Returns False if we match a command to prevent this
         message from being sent if the message is a command.
         """
-        for cmdprefix in COMMAND_PREFIXES:
-            if msg.startswith(cmdprefix):
+        # most messages aren't commands; bail out early for those
+        if not msg or msg[0] not in COMMAND_PREFIX_CHARS:
+            return True
+
+        for cmdprefix, plen in COMMAND_PREFIX_TABLE:
+            if msg[:plen] == cmdprefix:
                 return not self.cycle_thru_commands(msg, client_id, cmdprefix)
         return True
 
@@ -42,60 +52,45 @@ class CommandIntercept(ChatIntercept):
 
         Returns success.
         """
-        message = msg.split(" ")
-        command_entry = message[0].removeprefix(command_prefix)
+        head, _, _ = msg.partition(" ")
+        command_entry = head[len(command_prefix) :]
 
         # in case got a message with nothing but a prefix, ignore
         if not command_entry:
             return False
 
-        def run_command(call: Callable) -> bool:
-            try:
-                call()
-            except Exception as e:
-                logging.error("'%s' -> '%s'", msg, e, exc_info=True)
-                broadcast_message_to_client(
-                    client_id, bs.Lstr(resource="commands.error")
-                )
-            return True
-
         # if we're hosting, load up our server commands
         # these commands function exclusively when hosting
         # as they could mess around with gmae logic and nodes
-        for command in COMMAND_ALTAS_SERVER:
-            if command_entry in command.pseudos:
-                if are_we_host():
-                    # there is a chance a command could work for both clients
-                    # and servers (such as '/help').
-                    # let's make an exception for those.
-                    return run_command(
-                        lambda: command().execute(msg, client_id)
-                    )
-                # elif not are_we_host() and command in COMMAND_ALTAS_CLIENT:
-                #     return False
-                return False
-                # NOTE: we were meant to show an error telling the user
-                # the command they asked for is server-only, but that
-                # nullifies server-side logic... maybe there's a way
-                # for servers to communicate their command list so we
-                # can do this only when it's necessary?
-                # broadcast_message_to_client(
-                #     client_id,
-                #     bs.Lstr(
-                #         resource='commands.serveronly',
-                #         subs=[('${CMD}', command_entry)],
-                #     ),
-                # )
-
-        for command in COMMAND_ALTAS_CLIENT:
-            # afterwards, load up our client commands
-            # these ones work anywhere, including other
-            # servers that are not hosting with a modded core
-            if (
-                command_entry == command.name
-                or command_entry in command.pseudos
-            ):
-                return run_command(lambda: command().execute(msg, client_id))
+        command = SERVER_CMD_INDEX.get(command_entry)
+        if command is not None:
+            if are_we_host():
+                # there is a chance a command could work for both clients
+                # and servers (such as '/help').
+                # let's make an exception for those.
+                return self._run_command(command, msg, client_id)
+            # elif not are_we_host() and command in COMMAND_ALTAS_CLIENT:
+            #     return False
+            return False
+            # NOTE: we were meant to show an error telling the user
+            # the command they asked for is server-only, but that
+            # nullifies server-side logic... maybe there's a way
+            # for servers to communicate their command list so we
+            # can do this only when it's necessary?
+            # broadcast_message_to_client(
+            #     client_id,
+            #     bs.Lstr(
+            #         resource='commands.serveronly',
+            #         subs=[('${CMD}', command_entry)],
+            #     ),
+            # )
+
+        # afterwards, load up our client commands
+        # these ones work anywhere, including other
+        # servers that are not hosting with a modded core
+        command = CLIENT_CMD_INDEX.get(command_entry)
+        if command is not None:
+            return self._run_command(command, msg, client_id)
 
         if are_we_host():
             # we only show this as host to allow clients to
@@ -112,6 +107,22 @@ class CommandIntercept(ChatIntercept):
             return True
         return False
 
+    def _run_command(
+        self, command: Type[ChatCommand], msg: str, client_id: int
+    ) -> bool:
+        """Execute the provided command, reporting any errors it raises.
+
+        Always returns True, as the message has been handled.
+        """
+        try:
+            command().execute(msg, client_id)
+        except Exception as e:
+            logging.error("'%s' -> '%s'", msg, e, exc_info=True)
+            broadcast_message_to_client(
+                client_id, bs.Lstr(resource="commands.error")
+            )
+        return True
+
 
 CommandIntercept.register()
 
@@ -157,6 +168,9 @@ class ChatCommand:
         """
         cls._pseudos_check()
         COMMAND_ALTAS_CLIENT.add(cls)
+        CLIENT_CMD_INDEX[cls.name] = cls
+        for pseudo in cls.pseudos:
+            CLIENT_CMD_INDEX[pseudo] = cls
 
     @classmethod
     def register_server(cls) -> None:
@@ -169,6 +183,8 @@ class ChatCommand:
         """
         cls._pseudos_check()
         COMMAND_ALTAS_SERVER.add(cls)
+        for pseudo in cls.pseudos:
+            SERVER_CMD_INDEX[pseudo] = cls
 
     def execute(self, msg: str, client_id: int) -> None:
         """Runs the command!
@@ -198,19 +214,17 @@ class HelpCommand(ChatCommand):
     def execute(self, msg: str, client_id: int) -> None:
         del msg  # not needed
 
-        def host_send_custom_chatmessage(t: str):
-            if are_we_host():
-                send_custom_chatmessage(t)
+        if not are_we_host():
+            return
 
         t_bar = "- " * 18
-        text: str = f"- {t_bar} Command List (0/0) {t_bar}-\n"
-
-        host_send_custom_chatmessage(text)
-
-        for cmd in set().union(COMMAND_ALTAS_SERVER):
-            t = f"{cmd.name}: {cmd.description}\n"
+        parts: list[str] = [f"- {t_bar} Command List (0/0) {t_bar}-"]
+        parts.extend(
+            f"{cmd.name}: {cmd.description}" for cmd in COMMAND_ALTAS_SERVER
+        )
 
-            host_send_custom_chatmessage(t)
+        # send everything at once rather than one message per line
+        send_custom_chatmessage("\n".join(parts))
 
 
 HelpCommand.register_server()
@@ -8,12 +8,18 @@ from typing import Type, cast, override
 import bascenev1 as bs
 from bascenev1lib.actor.spaz import Spaz
 
+from fusecore.base.factory import Factory, FactorySound, FactoryTexture
 from fusecore.chat import ChatIntercept, get_players_from_client_id, are_we_host
 
 STICKER_ATLAS: set[Type[ChatSticker]] = set()
+STICKER_INDEX: dict[str, Type[ChatSticker]] = {}
 STICKER_DEFAULT: Type[ChatSticker] | None = None
 
-STICKER_PREFIXES: list[str] = [";"]
+STICKER_PREFIXES: tuple[str, ...] = (";",)
+STICKER_PREFIX_TABLE: tuple[tuple[str, int], ...] = tuple(
+    (p, len(p)) for p in STICKER_PREFIXES
+)
+STICKER_PREFIX_CHARS: frozenset[str] = frozenset(p[0] for p in STICKER_PREFIXES)
 
 SPAZ_STICKER_SCALE: float = 2.75
 
@@ -23,11 +29,15 @@ class StickerIntercept(ChatIntercept):
 
     @override
     def intercept(self, msg: str, client_id: int) -> bool:
+        # most messages aren't stickers; bail out early for those
+        if not msg or msg[0] not in STICKER_PREFIX_CHARS:
+            return True
+
         if not are_we_host():
             return True
 
-        for stkprefix in STICKER_PREFIXES:
-            if msg.startswith(stkprefix):
+        for stkprefix, plen in STICKER_PREFIX_TABLE:
+            if msg[:plen] == stkprefix:
                 return not self.cycle_thru_stickers(msg, client_id, stkprefix)
         return True
 
@@ -38,25 +48,30 @@ class StickerIntercept(ChatIntercept):
 
         Returns success.
         """
-        message = msg.split(" ")
-        sticker_entry = message[0].removeprefix(command_prefix)
-        del message
+        head, _, _ = msg.partition(" ")
+        sticker_entry = head[len(command_prefix) :]
 
         # in case got a message with nothing but a prefix, ignore
         if not sticker_entry:
             return False
 
-        for sticker in STICKER_ATLAS:
-            if sticker_entry in sticker.pseudos:
-                run_sticker(client_id, sticker)
-                return True
+        sticker = STICKER_INDEX.get(sticker_entry)
+        if sticker is None:
+            return False
 
-        return False
+        run_sticker(client_id, sticker)
+        return True
 
 
 StickerIntercept.register()
 
 
+class StickerFactory(Factory):
+    """Library class containing sticker textures and sounds."""
+
+    IDENTIFIER = "_sticker_factory"
+
+
 class ChatSticker:
     """A sticker that can be triggered via chat messages."""
 
@@ -76,6 +91,7 @@ class ChatSticker:
 
     duration_ms: int = 3000
     spaz_billboard_animation_dict: dict[float, float] = {}
+    _default_anim: dict[float, float] = {}
 
     @classmethod
     def register(cls) -> None:
@@ -86,6 +102,26 @@ class ChatSticker:
                 cls.name,
             )
         STICKER_ATLAS.add(cls)
+        for pseudo in cls.pseudos:
+            STICKER_INDEX[pseudo] = cls
+
+        if not cls.spaz_billboard_animation_dict:
+            sticker_time = max(1000, cls.duration_ms) / 1000
+            cls._default_anim = {
+                0.0: 0.0,
+                0.08: SPAZ_STICKER_SCALE * 1.075,
+                0.12: SPAZ_STICKER_SCALE,
+                sticker_time: SPAZ_STICKER_SCALE,
+                sticker_time + 0.1: 0.0,
+            }
+
+        StickerFactory.register_resource(
+            f"tex_{cls.texture_name}", FactoryTexture(cls.texture_name)
+        )
+        if cls.sound_name:
+            StickerFactory.register_resource(
+                f"snd_{cls.sound_name}", FactorySound(cls.sound_name)
+            )
 
     @classmethod
     def on_usage(
@@ -124,24 +160,19 @@ class SpazStickerCallout(Spaz):
         if not self.node:
             return
 
-        self.node.billboard_texture = bs.gettexture(sticker.texture_name)
+        factory = StickerFactory.instance()
+        self.node.billboard_texture = getattr(
+            factory, f"tex_{sticker.texture_name}"
+        )
         self.node.billboard_cross_out = False
 
-        sticker_time = max(1000, sticker.duration_ms) / 1000
-
         # Do a cool animation!
         bs.animate(
             self.node,
             "billboard_opacity",
             sticker.spaz_billboard_animation_dict
-            or {
-                0.0: 0.0,
-                0.08: SPAZ_STICKER_SCALE * 1.075,
-                0.12: SPAZ_STICKER_SCALE,
-                sticker_time: SPAZ_STICKER_SCALE,
-                sticker_time + 0.1: 0.0,
-            },
+            or sticker._default_anim,  # pylint: disable=protected-access
         )
 
         if sticker.sound_name:
-            bs.getsound(sticker.sound_name).play()
+            getattr(factory, f"snd_{sticker.sound_name}").play()
@@ -2,7 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Iterable
+
+import functools
+import math
 import os
+from random import uniform as _uniform
+
 import bascenev1 as bs
 import babase
 
@@ -23,24 +29,69 @@ LIBS_DIRECTORY: str = os.path.join(PYTHON_CORE_DIRECTORY, "libs")
 """Path to our modded core libraries folder."""
 
 
+_GOLDEN_ANGLE: float = math.pi * (3.0 - math.sqrt(5.0))
+_GOLDEN_COS: float = math.cos(_GOLDEN_ANGLE)
+_GOLDEN_SIN: float = math.sin(_GOLDEN_ANGLE)
+
+
+@functools.lru_cache(maxsize=32)
+def _fibonacci_sphere(count: int) -> tuple[tuple[float, float, float], ...]:
+    """Return 'count' unit directions evenly laid out on a sphere.
+
+    Results only depend on 'count', so they're cached for reuse.
+    """
+    if count <= 0:
+        return ()
+
+    # theta grows by a fixed angle per point, so rather than calling
+    # cos/sin for every point we rotate the previous (cos, sin) pair
+    # by that step; keeps large tables cheap to build.
+    step_c, step_s = _GOLDEN_COS, _GOLDEN_SIN
+    sqrt = math.sqrt
+    c, s = 1.0, 0.0
+    dy = 2.0 / count
+    y = 1.0 - dy * 0.5
+
+    points: list[tuple[float, float, float]] = []
+    append = points.append
+    for _ in range(count):
+        r = sqrt(max(0.0, 1.0 - y * y))
+        append((c * r, y, s * r))
+        c, s = c * step_c - s * step_s, s * step_c + c * step_s
+        y -= dy
+
+    return tuple(points)
+
+
 def vector3_spread(
     vector: tuple[float, float, float],
     spread_min: float = 1.0,
     spread_max: float = 1.0,
-) -> tuple[float, float, float]:
+    count: int = 1,
+) -> list[tuple[float, float, float]]:
     """Spread a Vector3 using a Fibonnaci Sphere.
     Used for spreading multiple objects around a specific area.
-    """
-    # FIXME: implement me!
-    raise RuntimeError("not implemented.")
-
-    import math, random
-
-    # generate fibonnaci
 
-    # spread randomly
-
-    return (1, 1, 1)
+    Returns 'count' positions around 'vector', each placed at a
+    random distance between 'spread_min' and 'spread_max'.
+    """
+    # spin the whole sphere randomly around the vertical axis
+    # so multiple spreads don't line up with each other
+    angle = _uniform(0.0, math.tau)
+    cos_a, sin_a = math.cos(angle), math.sin(angle)
+    vx, vy, vz = vector
+
+    out: list[tuple[float, float, float]] = []
+    for x, y, z in _fibonacci_sphere(count):
+        dist = _uniform(spread_min, spread_max)
+        out.append(
+            (
+                vx + (x * cos_a - z * sin_a) * dist,
+                vy + y * dist,
+                vz + (x * sin_a + z * cos_a) * dist,
+            )
+        )
+    return out
 
 
 def vector3_multfactor(
@@ -49,14 +100,29 @@ def vector3_multfactor(
     factor_max: float = 1.0,
 ) -> tuple[float, float, float]:
     """Randomize a vector3 within a specific multiplication range."""
+    return (
+        vector[0] * _uniform(factor_min, factor_max),
+        vector[1] * _uniform(factor_min, factor_max),
+        vector[2] * _uniform(factor_min, factor_max),
+    )
 
-    def _randmult() -> float:
-        from random import uniform as ru
 
-        return 1.0 * ru(factor_min, factor_max)
+def vector3_multfactor_batch(
+    vectors: Iterable[tuple[float, float, float]],
+    factor_min: float = 1.0,
+    factor_max: float = 1.0,
+) -> list[tuple[float, float, float]]:
+    """Randomize multiple vector3s within a specific multiplication range.
 
-    return (
-        vector[0] * _randmult(),
-        vector[1] * _randmult(),
-        vector[2] * _randmult(),
-    )
+    Same as 'vector3_multfactor', but handles a whole collection
+    of vectors in a single call.
+    """
+    uniform = _uniform
+    return [
+        (
+            x * uniform(factor_min, factor_max),
+            y * uniform(factor_min, factor_max),
+            z * uniform(factor_min, factor_max),
+        )
+        for x, y, z in vectors
+    ]
@@ -13,17 +13,33 @@ from .common import DATA_DIRECTORY
 REPLAY_FOLDERS: list[str] = [os.path.join(DATA_DIRECTORY, "replays")]
 
 
-def _get_replays_dir_from_path(path: str) -> list[str]:
-    output: list[str] = []
+_REPLAY_CACHE: dict[str, tuple[int, list[str]]] = {}
+"""Replay listings per folder, alongside the folder's mtime at scan."""
+
 
-    if not (os.path.exists(path) and os.path.isdir(path)):
+def _get_replays_dir_from_path(path: str) -> list[str]:
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime = None
+    if mtime is None or not os.path.isdir(path):
         raise FileNotFoundError(f"invalid path: '{path}'")
 
-    for filename in os.listdir(path):
-        if os.path.splitext(filename)[1].lower() == ".brp":
-            output.append(os.path.join(path, filename))
+    # a folder's mtime changes whenever files are added or removed,
+    # so we only need to re-scan when that happens.
+    cached = _REPLAY_CACHE.get(path)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
+
+    with os.scandir(path) as it:
+        output: list[str] = [
+            entry.path
+            for entry in it
+            if entry.name.lower().endswith(".brp") and entry.is_file()
+        ]
 
-    return output
+    _REPLAY_CACHE[path] = (mtime, output)
+    return list(output)
 
 
 def get_user_replays() -> list[str]:
@@ -35,7 +51,7 @@ def get_demo_replays() -> list[str]:
     """Get all replays from the 'REPLAY_FOLDERS' list."""
     replays: list[str] = []
     for folder_path in REPLAY_FOLDERS:
-        _get_replays_dir_from_path(folder_path)
+        replays.extend(_get_replays_dir_from_path(folder_path))
 
     return replays
 
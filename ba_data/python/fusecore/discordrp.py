@@ -1,12 +1,12 @@
 """Discord Rich Presence module."""
 
-from dataclasses import dataclass
+from __future__ import annotations
+
 import time
 import random
-import threading
 import logging
 import hashlib
-from enum import Enum
+import json
 from typing import Any
 
 import babase
@@ -16,12 +16,26 @@ from babase._appsubsystem import AppSubsystem
 from bascenev1lib.mainmenu import MainMenuActivity
 from bauiv1lib.gather.publictab import PartyEntry
 
-from fusecore.libs.discordrp import Presence
+from fusecore._richpresence import (  # pylint: disable=unused-import
+    FATAL_EXC,
+    RPStatusType,
+    RPDisplayType,
+    RPTimestamps,
+    RPEmoji,
+    RichPresenceStatus,
+    ThreadState,
+    RichPresenceThread,
+)
 
 # General data
 APP_CLIENT_ID = "1439177584993894460"
 TIME_UPDATE: int = 1
-TIME_WAIT: float = 0.33
+ALLOWABLE_UPDATE_LATENCY: float = 2.0
+"""Seconds to hold back status changes for after sending one.
+
+Changes within this window are coalesced and only the latest
+one is sent once it's over.
+"""
 IDLE_TIME: int = 15
 HIDE_ONLINE: bool = False
 # Reconnection retry attributes
@@ -32,7 +46,8 @@ RETRY_TIME_START: float = 8
 RETRY_TIME_MULT: float = 1.2
 RETRY_TIME_MAX: int = 20
 RETRY_ATTEMPTS: int = 15
-
+RETRY_JITTER: tuple[float, float] = (0.8, 1.2)
+"""Range our retry time gets randomly scaled by on each attempt."""
 DISPLAY_TIME_IS_RUNTIME = False
 """Is our display time how long we've been playing the game?
 
@@ -72,177 +87,53 @@ MAPICON_STR: dict = {
     "Tower D": "towerd",
     "Zigzag": "zigzag",
 }
+MAPICON_FULL: dict[str, str] = {
+    k: MAPICON_PRE + v for k, v in MAPICON_STR.items()
+}
+"""'MAPICON_STR' entries with 'MAPICON_PRE' already applied."""
+UNKNOWN_MAP_ICON: str = MAPICON_PRE + "unknown"
+LOGO_ASSETS: dict[str, str] = {"large_image": "claypocalypse_logo_final"}
+"""Asset data shared by all logo statuses. Merge it in; don't modify it."""
+REPLAY_ASSETS: dict[str, str] = {"large_image": "replay"}
+
+SESSION_SUFFIX: dict[type[bs.Session], str] = {
+    bs.CoopSession: "coop",
+    bs.FreeForAllSession: "ffa",
+    bs.DualTeamSession: "teams",
+}
+"""Session resource suffixes by session type.
 
+Subclasses get added in as we come across them; session types we
+don't know about are stored with an empty suffix and show no name.
+"""
 
-def _log() -> logging.Logger:  # This thing is awesome.
-    return logging.getLogger(__name__)
-
-
-class RPStatusType(Enum):
-    """Rich Presence state type.
-    This type is related to how our Rich Presence is
-    displayed on discord.
-
-    e.g. 'RPStatusType.PLAYING' will display "Playing BombSquad"
-    while 'RPStatusType.WATCHING' will show "Watching BombSquad"
-
-    NOTE: Status type 'WATCHING' is hardcoded and does not work!
-    """
 
-    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-types
-    PLAYING = 0
-    STREAMING = 1
-    LISTENING = 2
-    WATCHING = 3
-    CUSTOM = 4
-    COMPETING = 5
-
-
-class RPDisplayType(Enum):
-    # https://discord.com/developers/docs/events/gateway-events#activity-object-status-display-types
-    NAME = 0
-    STATE = 1
-    DETAILS = 2
-
-
-@dataclass
-class RPTimestamps:
-    """Rich Presence timestamps collection."""
-
-    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-timestamps
-    start: int
-    end: int
-
-    def to_dict(self) -> dict:
-        return {
-            "start": self.start,
-            "end": self.end,
-        }
-
-
-@dataclass
-class RPEmoji:
-    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-emoji
-    # FIXME: is this even needed in this context?
-    name: str
-    id: str = ""
-    animated: bool = False
-
-
-@dataclass
-class RichPresenceStatus:
-    """Discord Activity Status."""
-
-    # https://discord.com/developers/docs/events/gateway-events#activity-object-activity-structure
-    name: str
-    type: RPStatusType
-    created_at: int
-
-    url = None
-    """Used for streams, goes unused here."""
-    timestamps: RPTimestamps | None = None
-    """Start and end times of our activity, displayed as a timer."""
-    application_id: str = ""
-    status_display_type: RPDisplayType = RPDisplayType.NAME
-
-    details: str = ""
-    details_url: str = ""
-    state: str = ""
-    state_url: str = ""
-
-    # FIXME: is this even needed in this context?
-    emoji: RPEmoji | None = None
-
-    # TODO: implement me!
-    party = None
-    assets = None
-    secrets = None
-    instance = None
-    flags = None
-    buttons = None
-
-
-class ThreadState(Enum):
-    INACTIVE = 0
-    ACTIVE = 1
-    STOPPED = -1
-
-
-class RichPresenceThread(threading.Thread):
-    def __init__(self):
-        """Create a thread to dynamically change
-        our Discord Rich Presence status between activities.
-        """
-        super().__init__()
-        self.presence: Presence | None = None
-        self.status: ThreadState = ThreadState.INACTIVE
-        self._should_stop = threading.Event()
-
-    def _handle_error(self, exc: Exception) -> None:
-        """Handle not being able to send a Rich Presence request."""
-        self.status = ThreadState.STOPPED
-        # If we OSError, we probably lost connection.
-        # Don't make a fuss about it.
-        if isinstance(exc, OSError) and not isinstance(exc, FileNotFoundError):
-            return
-        _log().error(
-            "Something wrong occurred while handling a rich presence request.\n"
-            f"ThreadState: {self.status}",
-            exc_info=exc,
-        )
+_LOG = logging.getLogger(__name__)
+"""Our logger; kept around as we log from our update cycle."""
 
-    def _start_presence(self) -> None:
-        """Try executing our presence."""
-        # Start running and mantain our presence.
-        try:
-            _log().info("Starting 'RichPresenceThread'...")
-            with Presence(APP_CLIENT_ID) as presence:
-                self.presence = presence
-                presence.set(
-                    {
-                        "assets": {
-                            "large_image": "claypocalypse_logo_final",
-                        }
-                    }
-                )
-                self.status = ThreadState.ACTIVE
-                _log().info(
-                    "'RichPresenceThread' started successfully!\n"
-                    "Waiting for our DiscordRPSubsystem to link..."
-                )
-                # Keep it running!
-                while not self._should_stop.is_set():
-                    time.sleep(0.1)
-                self.status = ThreadState.STOPPED
-                _log().info("'RichPresenceThread' stopped.")
-
-        except Exception as e:
-            self._handle_error(e)
-
-    def set(self, data: dict) -> None:
-        """Set our presence."""
-        # https://discord.com/developers/docs/topics/gateway-events#activity-object-activity-structure
-        if self.presence is None:
-            _log().warning(
-                "No DiscordRPSubsystem linked while tying to set presence status?",
-                stack_info=True,
-            )
-            return
 
-        _log().info("Set our Discord Presence Status.\n" f"Provided: {data}")
+_SERVER_SPEC_CACHE: dict[str, bool] = {}
+_SERVER_SPEC_CACHE_LIMIT = 64
 
-        try:
-            self.presence.set(data)
-        except Exception as e:
-            self._handle_error(e)
 
-    def stop(self) -> None:
-        """Stop our presence."""
-        self._should_stop.set()
+def _is_server_spec(spec: str) -> bool:
+    """Return whether a roster entry's 'spec_string' belongs to the host.
 
-    def run(self):
-        self._should_stop = threading.Event()
-        self._start_presence()
+    Results are cached per spec string, as rosters rarely change.
+    """
+    is_server = _SERVER_SPEC_CACHE.get(spec)
+    if is_server is None:
+        # Most specs won't mention a server at all; skip parsing those.
+        is_server = False
+        if '"Server"' in spec:
+            try:
+                is_server = json.loads(spec).get("a") == "Server"
+            except (ValueError, AttributeError):
+                pass
+        if len(_SERVER_SPEC_CACHE) >= _SERVER_SPEC_CACHE_LIMIT:
+            _SERVER_SPEC_CACHE.clear()
+        _SERVER_SPEC_CACHE[spec] = is_server
+    return is_server
 
 
 class DiscordRPSubsystem(AppSubsystem):
@@ -266,27 +157,45 @@ class DiscordRPSubsystem(AppSubsystem):
 
         self.data: dict = {}
         self.latest_data: dict = {}
+        self._latest_sig: int = 0
+        self._pending_data: dict | None = None
+        self._pending_sig: int = 0
+        self._flush_deadline: float = 0
+        self.flush_timer: bs.AppTimer | None = None
 
         self.time_start: int = 1
         self.time_end: int | None = 1
 
         self.activity_hash: int | None = None
-        self.last_time_update: int = -9999
+        self._next_end_update_at: float = 0
+        """'time.monotonic()' value past which we resync our end time."""
+        self._inputs_prev: tuple = ()
+        """Everything our last built status depended on."""
         self.update_timer: bs.AppTimer | None = None
 
         self.retry_timer: bs.AppTimer | None = None
         self.retry_time: float = RETRY_TIME_START
         self.retry_attempt: int = 0
-
-        self.last_listing_fetch: float = 1
+        self._fatal: bool = False
+        self._lost_connection: bool = False
+        """Did our pending retries start from losing a live connection?"""
+
+        self._next_listing_fetch_at: float = 0
+        """'time.monotonic()' value past which we can refetch our listing."""
+        self._listing_in_flight: bool = False
+        self._listing_query: dict[str, Any] = {}
         self.current_server_data: PartyEntry | None = None
         self.server_listing: dict = {}
+        self._server_index: dict[tuple[Any, Any], dict] = {}
+        """'server_listing' entries keyed by their address and port."""
         self.server_entry: dict = {}
 
         self._party_id: str = ""
         self._join_secret: str = ""
 
         self.r = "discordrp"
+        self._lstr_cache: dict[str, str] = {}
+        self._lstr_cache_lang: str | None = None
 
     def on_app_running(self) -> None:
         """Start automatically when our app reaches running state,
@@ -295,13 +204,34 @@ class DiscordRPSubsystem(AppSubsystem):
         if AUTO_START:
             self.start()
 
+    def _tr(self, resource: str) -> str:
+        """Return the evaluated translation of the provided resource.
+
+        Results are cached until our language changes.
+        """
+        lang = bs.app.lang.language
+        if lang != self._lstr_cache_lang:
+            self._lstr_cache.clear()
+            self._lstr_cache_lang = lang
+
+        cache = self._lstr_cache
+        v = cache.get(resource)
+        if v is None:
+            v = cache[resource] = bs.Lstr(resource=resource).evaluate()
+        return v
+
     def _reset_variables(self) -> None:
+        self._lstr_cache.clear()
         self.data = {}
         self.latest_data = {}
+        self._latest_sig = 0
+        self._pending_data = None
+        self._flush_deadline = 0
         self.time_start = 1
         self.time_end = 1
         self.activity_hash = None
-        self.last_time_update = -9999
+        self._next_end_update_at = 0
+        self._inputs_prev = ()
         self.retry_time = RETRY_TIME_START
         self.retry_attempt = 0
         # Generate secrets too
@@ -310,38 +240,76 @@ class DiscordRPSubsystem(AppSubsystem):
         self.generate_secrets()
 
     def _update_status(self, data: dict) -> None:
-        if self._thread and (data != self.latest_data or DATA_PERSISTENT):
-            self._thread.set(data)
-            self.latest_data = data
+        if not self._thread:
+            return
+        # Compare a fingerprint of our data rather than walking
+        # both nested dicts every tick.
+        sig = hash(repr(data))
+        if sig == self._latest_sig and not DATA_PERSISTENT:
+            # we're back to what's being displayed; nothing to send.
+            self._pending_data = None
+            return
+        # Discord rate-limits status changes anyway, so hold on
+        # to anything that comes in too soon after our last send.
+        if time.monotonic() < self._flush_deadline:
+            self._pending_data = data
+            self._pending_sig = sig
+            return
+        self._send_status(data, sig)
+
+    def _send_status(self, data: dict, sig: int) -> None:
+        assert self._thread is not None
+        self._pending_data = None
+        self._thread.set(data)
+        self.latest_data = data
+        self._latest_sig = sig
+        self._flush_deadline = time.monotonic() + ALLOWABLE_UPDATE_LATENCY
+
+    def _flush_pending(self) -> None:
+        """Send our held back status, if any."""
+        if (
+            self._pending_data is None
+            or self._thread is None
+            or time.monotonic() < self._flush_deadline
+        ):
+            return
+        self._send_status(self._pending_data, self._pending_sig)
 
-    def _get_start_time(self) -> int:
-        if hash(bs.get_foreground_host_activity()) != self.activity_hash and (
+    def _get_start_time(self, activity_hash: int) -> int:
+        if activity_hash != self.activity_hash and (
             not DISPLAY_TIME_IS_RUNTIME or self.time_start == 1
         ):
             self.time_start = int(time.time())
         return self.time_start
 
-    def _get_end_time(self) -> int | None:
-        activity: bs.GameActivity = bs.get_foreground_host_activity()
+    def _get_end_time(
+        self, activity: bs.GameActivity, activity_hash: int
+    ) -> int | None:
         try:
+            gnode = activity.globalsnode
+            same_activity = activity_hash == self.activity_hash
+            # Slow motion throws off our timer; keep what we had
+            # (if it was for this same activity.)
+            if gnode.slow_motion:
+                if not same_activity:
+                    self.time_end = None
+                return self.time_end
             # Only update end time per activity change,
             # when we're paused and every 5 seconds
             # (to prevent major desyncs)
             if (
-                hash(activity) != self.activity_hash
-                or activity.globalsnode.paused
-                or int(time.time()) > self.last_time_update
-            ) and not activity.globalsnode.slow_motion:
-                self.time_end = None
-                if isinstance(activity, bs.GameActivity):
-                    self.time_end = int(time.time()) + (
-                        activity._standard_time_limit_time or 0
-                    )
-                    self.last_time_update = int(time.time()) + 5
-            elif hash(activity) == self.activity_hash:
-                pass
-            else:
-                self.time_end = None
+                same_activity
+                and not gnode.paused
+                and time.monotonic() < self._next_end_update_at
+            ):
+                return self.time_end
+            self.time_end = None
+            if isinstance(activity, bs.GameActivity):
+                # Discord wants wall time for its timestamps.
+                self.time_end = int(time.time()) + (
+                    activity._standard_time_limit_time or 0
+                )
+                self._next_end_update_at = time.monotonic() + 5
         except Exception:
             self.time_end = None
         return self.time_end
@@ -356,7 +324,7 @@ class DiscordRPSubsystem(AppSubsystem):
     def _get_map_large_image(self, activity: bs.GameActivity) -> str:
         """Return our large image asset for our GameActivity's map."""
         # Check and translate our current map's name.
-        return f'{MAPICON_PRE}{MAPICON_STR.get(activity.map.name, "unknown")}'
+        return MAPICON_FULL.get(activity.map.name, UNKNOWN_MAP_ICON)
 
     def _get_game_details(
         self, session: bs.Session, set_activity: bs.Lstr | str
@@ -373,37 +341,30 @@ class DiscordRPSubsystem(AppSubsystem):
         Returns:
             str: Our evaluated details string.
         """
-        return "hello!"
-
-        session_name = f"{self.r}.session."
-        if isinstance(session, bs.CoopSession):
-            if session.campaign is not None:
-                session_name += f"coop.{session.campaign.name}"
-            else:
-                session_name += "other"
-
-        elif isinstance(session, bs.FreeForAllSession):
-            session_name += "ffa"
+        sessiontype = type(session)
+        suffix = SESSION_SUFFIX.get(sessiontype)
+        if suffix is None:
+            suffix = ""
+            for cls, cls_suffix in SESSION_SUFFIX.items():
+                if cls_suffix and isinstance(session, cls):
+                    suffix = cls_suffix
+                    break
+            SESSION_SUFFIX[sessiontype] = suffix
 
-        elif isinstance(session, bs.FreeForAllSession):
-            session_name += "teams"
-
-        else:
-            session_name += "other"
-
-        return bs.Lstr(
-            value="${SESSION} | ${ACTIVITY}",
-            subs=[
-                ("${SESSION}", bs.Lstr(resource=session_name)),
-                ("${ACTIVITY}", set_activity),
-            ],
-        ).evaluate()
+        activity_name = (
+            set_activity.evaluate()
+            if isinstance(set_activity, bs.Lstr)
+            else set_activity
+        )
+        if not suffix:
+            return activity_name
+        return f"{self._tr(f'{self.r}.session.{suffix}')} | {activity_name}"
 
     def generate_secrets(self) -> None:
         """Get our online address, port and if we're accessible.
         Generate secrets out of that once fetched.
         """
-        _log().info("Preparing to generate secrets...")
+        _LOG.info("Preparing to generate secrets...")
         if bs.app.classic is not None:
             bs.app.classic.master_server_v1_get(
                 "bsAccessCheck",
@@ -415,13 +376,13 @@ class DiscordRPSubsystem(AppSubsystem):
         """Generate secrets for handling discord join requests."""
         # Very lame case handler
         if data is None:
-            _log().info("No data to generate secrets.")
+            _LOG.info("No data to generate secrets.")
             return
         elif not data.get("accessible", False):
-            _log().info("Party is unjoinable, ignoring secrets.")
+            _LOG.info("Party is unjoinable, ignoring secrets.")
             return
 
-        _log().info(f"Generating secrets\nData: {data}")
+        _LOG.info("Generating secrets\nData: %s", data)
 
         address = data.get("address", None)
         port = data.get("port", None)
@@ -455,9 +416,9 @@ class DiscordRPSubsystem(AppSubsystem):
             bs.get_public_party_enabled() and not discord_ckey == "Never"
         ) or discord_ckey in "Always"
 
-    def _hide_local_party_status(self) -> None:
+    def _hide_local_party_status(self, roster: list[dict[str, Any]]) -> None:
         """Hide our status if we're not in a party and don't allow joining."""
-        if not bs.get_game_roster() and not self._get_allow_joining():
+        if not roster and not self._get_allow_joining():
             self.data.pop("state", None)
             self.data.pop("party", None)
 
@@ -468,7 +429,7 @@ class DiscordRPSubsystem(AppSubsystem):
         return self._thread.status
 
     def is_active(self) -> bool:
-        return bool(self.update_timer)
+        return self._thread is not None or bool(self.update_timer)
 
     def _process_stop(self) -> None:
         if self._thread is not None:
@@ -483,7 +444,7 @@ class DiscordRPSubsystem(AppSubsystem):
         in case our player has been gone for too long.
         Else, return our provided "active" text.
         """
-        default = bs.Lstr(resource=f"{self.r}.idle").evaluate()
+        default = self._tr(f"{self.r}.idle")
         return (
             (
                 default
@@ -509,20 +470,28 @@ class DiscordRPSubsystem(AppSubsystem):
                 # (don't mark it as an error as we might be trying to
                 #  reconnect in case we lost connection to Discord.)
                 if self._thread is not None:
-                    _log().warning(
+                    _LOG.warning(
                         "Tried to start while already running?", stack_info=True
                     )
                     return
 
-                self._thread = RichPresenceThread()
-                self._thread.start()
-                self.update_timer = bs.AppTimer(
-                    TIME_WAIT,
-                    bs.CallPartial(self.rp_wait_for, reconnect=reconnect),
-                    repeat=True,
+                # Manual starts get a clean slate.
+                if not reconnect:
+                    self._fatal = False
+                    self.retry_timer = None
+
+                # Our thread lets us know once it's up (or down)
+                # so we don't have to poll it while it connects.
+                self._thread = RichPresenceThread(
+                    APP_CLIENT_ID,
+                    on_state_change=bs.CallPartial(
+                        self._on_thread_state_change, reconnect=reconnect
+                    ),
+                    initial_data={"assets": LOGO_ASSETS},
                 )
+                self._thread.start()
             else:
-                _log().warning(
+                _LOG.warning(
                     "DiscordRPSubsystem won't start in "
                     "server mode or non-desktop environments."
                 )
@@ -533,12 +502,50 @@ class DiscordRPSubsystem(AppSubsystem):
         """
         self._process_stop()
         self.update_timer = None
-        _log().info("DiscordRPSubsystem halted.")
+        self.flush_timer = None
+        _LOG.info("DiscordRPSubsystem halted.")
+        # Each failed attempt schedules the next one by coming back here,
+        # so there's only ever one retry pending.
+        self.retry_timer = None
         if retry:
-            _log().info("Attempting Subsystem restart!")
-            self.retry_timer = bs.AppTimer(
-                self.retry_time, self.rp_reconnect, repeat=True
+            delay = self._get_retry_delay()
+            _LOG.info("Attempting Subsystem restart in %.2fs!", delay)
+            self.retry_timer = bs.AppTimer(delay, self.rp_reconnect)
+
+    def _get_retry_delay(self) -> float:
+        """Return our retry time with some jitter applied."""
+        return self.retry_time * random.uniform(*RETRY_JITTER)
+
+    def _stop_lost(self, was_connected: bool = False) -> None:
+        """Stop after our thread stopped, retrying if it makes sense.
+
+        'was_connected' tells losing a live connection apart from failing
+        to connect; retries follow whichever one started them.
+        """
+        assert self._thread is not None
+        if was_connected:
+            self._lost_connection = True
+        self._fatal = self._thread.fatal
+        if self._fatal:
+            _LOG.warning("Can't connect to Discord, won't retry.")
+        self.stop(
+            retry=(
+                RETRY_ON_DISCONNECT
+                if self._lost_connection
+                else RETRY_ON_BOOT_FAIL
             )
+            and not self._fatal
+        )
+
+    def _on_thread_state_change(
+        self, thread: RichPresenceThread, reconnect: bool = False
+    ) -> None:
+        """Handle a state change notification from our thread."""
+        # Ignore threads we've let go of already; once our update
+        # cycle is running, 'update' handles disconnections itself.
+        if thread is not self._thread or self.update_timer is not None:
+            return
+        self.rp_wait_for(reconnect=reconnect)
 
     def rp_wait_for(self, reconnect: bool = False) -> None:
         """Wait for our DRPProcess to become active.
@@ -549,52 +556,134 @@ class DiscordRPSubsystem(AppSubsystem):
 
         # Switch our timer to updates once it activates.
         if self._thread.status is ThreadState.ACTIVE:
-            _log().info("DiscordRPSubsystem up and running!")
+            # We're connected; reset our backoff right away.
+            self.retry_time = RETRY_TIME_START
+            self.retry_attempt = 0
+            self.retry_timer = None
+            _LOG.info("DiscordRPSubsystem up and running!")
             self.update_timer = bs.AppTimer(
                 TIME_UPDATE, self.update, repeat=True
             )
-            self.retry_timer = None
+            self.flush_timer = bs.AppTimer(
+                ALLOWABLE_UPDATE_LATENCY, self._flush_pending, repeat=True
+            )
             self._reset_variables()
         # We lost connection...?
         elif self._thread.status is ThreadState.STOPPED:
-            self.stop(retry=RETRY_ON_DISCONNECT and not reconnect)
+            # Failing a fresh start is a boot failure, not a disconnect.
+            if not reconnect:
+                self._lost_connection = False
+            self._stop_lost()
 
     def rp_reconnect(self) -> None:
         """Attempt running back our RP process in case of a disconnection."""
-        self.retry_time = min(RETRY_TIME_MAX, self.retry_time * RETRY_TIME_MULT)
+        self.retry_timer = None
+        # No point in trying again if our last attempt can't ever work.
+        if self._fatal:
+            return
+        # Only grow our backoff if our previous attempt failed;
+        # connecting resets it in 'rp_wait_for'.
+        if self.retry_attempt > 0:
+            self.retry_time = min(
+                RETRY_TIME_MAX, self.retry_time * RETRY_TIME_MULT
+            )
         self.retry_attempt += 1
         if not self.retry_attempt > RETRY_ATTEMPTS and not RETRY_ATTEMPTS < 0:
-            _log().info(
-                "Attempting reconnection!" f"({self.retry_time} seconds)"
-            )
-            self.retry_timer = bs.AppTimer(
-                self.retry_time, self.rp_reconnect, repeat=True
-            )
+            _LOG.info("Attempting reconnection! (#%d)", self.retry_attempt)
+            # If this fails, we'll get stopped and schedule our next try.
             self.start(reconnect=True)
         else:
-            _log().info("Reached reconnect attempt limit, stopping!")
-            self.retry_timer = None
+            _LOG.info("Reached reconnect attempt limit, stopping!")
 
     def update(self) -> None:
         """Perform a Rich Presence status update."""
         if not self._thread:
             return
 
-        _log().debug("DiscordRPSubsystem update cycle start")
+        _LOG.debug("DiscordRPSubsystem update cycle start")
 
         # Stop the subsystem if we lose connection.
         if self._thread.status is ThreadState.STOPPED:
-            self.stop(retry=RETRY_ON_DISCONNECT)
+            self._stop_lost(was_connected=True)
             return
 
+        # Grab everything we need from the engine just once per tick.
         activity: bs.Activity = bs.get_foreground_host_activity()
         session: bs.Session = bs.get_foreground_host_session()
+        roster = bs.get_game_roster()
+        host_info = bs.get_connection_to_host_info_2()
+        activity_hash = hash(activity)
+        allow_joining = self._get_allow_joining()
+
+        # Our status is built purely out of these, so if none of them
+        # changed since last time, what we've got is still good.
+        inputs = self._get_status_inputs(
+            activity, session, roster, host_info, allow_joining
+        )
+        if self._is_status_current(inputs, activity):
+            return
         self.data = {}
 
-        # Regardless of our current activity,
-        # show our party size if we are in or hosting one.
-        party = None if not bs.get_game_roster() else len(bs.get_game_roster())
-        allow_joining = self._get_allow_joining()
+        self._set_party_data(roster, host_info, allow_joining)
+        self.data["state"] = self._get_players_state(
+            session, roster, allow_joining
+        )
+        if not self._set_activity_data(
+            activity, session, roster, host_info, activity_hash
+        ):
+            return
+        self.activity_hash = activity_hash
+        self._inputs_prev = inputs
+
+        # Update presence with our active data!
+        self._update_status(self.data)
+
+    def _get_status_inputs(
+        self,
+        activity: bs.Activity | None,
+        session: bs.Session | None,
+        roster: list[dict[str, Any]],
+        host_info: Any,
+        allow_joining: bool,
+    ) -> tuple:
+        """Return everything our status gets built out of."""
+        return (
+            hash(activity),
+            type(session),
+            len(session.sessionplayers) if session is not None else 0,
+            len(roster),
+            allow_joining,
+            bs.get_public_party_max_size(),
+            bool(self._join_secret and self._party_id),
+            getattr(host_info, "name", None),
+            activity is None and bs.is_in_replay(),
+            self.server_entry.get("sm"),
+            babase.get_input_idle_time() >= IDLE_TIME,
+            isinstance(activity, bs.GameActivity)
+            and activity.globalsnode.paused,
+            bs.app.lang.language,
+        )
+
+    def _is_status_current(
+        self, inputs: tuple, activity: bs.Activity | None
+    ) -> bool:
+        """Return whether our last built status still holds up."""
+        return (
+            inputs == self._inputs_prev
+            and bool(self.data)
+            and not DATA_PERSISTENT
+            # Our end time still needs resyncing every now and then.
+            and not (
+                isinstance(activity, bs.GameActivity)
+                and time.monotonic() >= self._next_end_update_at
+            )
+        )
+
+    def _set_party_data(
+        self, roster: list[dict[str, Any]], host_info: Any, allow_joining: bool
+    ) -> None:
+        """Show our party (and how to join it) if we're in or hosting one."""
+        party = len(roster) or None
         if party or allow_joining:
             self.data.update(
                 {
@@ -608,70 +697,69 @@ class DiscordRPSubsystem(AppSubsystem):
         # and are hosting our own party.
         if (
             allow_joining
-            and not bs.get_connection_to_host_info_2()
+            and not host_info
             and self._join_secret
             and self._party_id
         ):
-            self.data.update(
-                {
-                    "secrets": {
-                        "join": self._join_secret,
-                    },
-                }
-            )
-        # If we're playing, show our crew status;
-        # either if we're by ourselves, with friends locally or online.
-        sessionplayers = 1
-        if session is not None:
-            sessionplayers = len(session.sessionplayers)
-        self.data["state"] = bs.Lstr(
-            resource=f"{self.r}.players."
-            + (
-                "solo"
-                if not party and sessionplayers < 2
-                else (
-                    "coop"
-                    if not party and isinstance(session, bs.CoopSession)
-                    else (
-                        "multi"
-                        if not party
-                        else "public" if allow_joining else "private"
-                    )
-                )
-            ),
-        ).evaluate()
+            self.data["secrets"] = {"join": self._join_secret}
 
+    def _get_players_state(
+        self,
+        session: bs.Session | None,
+        roster: list[dict[str, Any]],
+        allow_joining: bool,
+    ) -> str:
+        """Return our crew status; either if we're by ourselves,
+        with friends locally or online.
+        """
+        if roster:
+            kind = "public" if allow_joining else "private"
+        elif session is not None and len(session.sessionplayers) >= 2:
+            kind = "coop" if isinstance(session, bs.CoopSession) else "multi"
+        else:
+            kind = "solo"
+        return self._tr(f"{self.r}.players.{kind}")
+
+    def _set_activity_data(
+        self,
+        activity: bs.Activity | None,
+        session: bs.Session,
+        roster: list[dict[str, Any]],
+        host_info: Any,
+        activity_hash: int,
+    ) -> bool:
+        """Fill in our status for our current activity.
+
+        Returns False if we'd rather not update for this one.
+        """
         # Online / Replay
         if activity is None:
-            if bs.get_connection_to_host_info_2():
-                self.set_presence_online()
+            if host_info:
+                self.set_presence_online(host_info, roster, activity_hash)
             elif bs.is_in_replay():
-                self.set_presence_replay()
+                self.set_presence_replay(roster, activity_hash)
             # If we reach this point, the player might be
             # presentiating a dark void as they broke the game
             # because this is not supposed to happen.
             # In this case, let's lie a little and say
             # our player is looking at the main menu.
             else:
-                self.set_presence_main_menu()
+                self.set_presence_main_menu(roster, activity_hash)
         # Main Menu
         elif isinstance(activity, MainMenuActivity):
-            self.set_presence_main_menu()
+            self.set_presence_main_menu(roster, activity_hash)
         # Generic Game
         elif isinstance(activity, bs.GameActivity):
-            self.set_presence_in_game()
+            self.set_presence_in_game(activity, session, activity_hash)
         # Joining Game
         elif isinstance(activity, bs.JoinActivity):
-            self.set_presence_join()
+            self.set_presence_join(session, activity_hash)
         # Anything else (transitions, victory screens...)
         else:
             # We actually don't want to update here to make
             # transitions between activities smoother.
-            return
-        self.activity_hash = hash(activity)
-
-        # Update presence with our active data!
-        self._update_status(self.data)
+            return False
+        return True
 
     def find_and_get_server_data(self) -> None:
         """Find all available active server data."""
@@ -679,59 +767,66 @@ class DiscordRPSubsystem(AppSubsystem):
         # method is REALLY ugly... We're gonna get a list
         # of all servers and then cherry-pick the one we're in.
         if bs.app.plus is None:
-            logging.warning(
-                '"find_and_get_server_data" requires plus features.'
-            )
+            _LOG.warning('"find_and_get_server_data" requires plus features.')
             return
 
         plus = bs.app.plus
 
-        def got_results(results: dict) -> None:
+        def got_results(results: dict, fetched: bool = False) -> None:
+            if fetched:
+                self._listing_in_flight = False
+                self._next_listing_fetch_at = (
+                    time.monotonic() + SERVER_LISTING_UPDATE
+                )
             # Extract data from here.
             if not results:
                 return
 
-            _log().debug(
-                "server data results:" f"{results}",
-            )
+            _LOG.debug("server data results: %s", results)
 
-            self.server_listing = results
-            if self.current_server_data is not None:
-                self.server_entry = (
-                    [
-                        entry
-                        for entry in self.server_listing.get("l", [])
-                        if entry.get("a", None)
-                        == self.current_server_data.address
-                        and entry.get("p", None)
-                        == self.current_server_data.port
-                    ]
-                    or [{}]
-                )[0]
-            else:
-                self.server_entry = {}
+            # Index fresh listings so picking our entry is a lookup.
+            if results is not self.server_listing:
+                self.server_listing = results
+                self._server_index = {
+                    (entry.get("a"), entry.get("p")): entry
+                    for entry in results.get("l", [])
+                }
+            server = self.current_server_data
+            self.server_entry = (
+                self._server_index.get((server.address, server.port), {})
+                if server is not None
+                else {}
+            )
 
         # If we already did this earlier, use our previous results.
-        if not time.time() > self.last_listing_fetch + SERVER_LISTING_UPDATE:
+        if time.monotonic() < self._next_listing_fetch_at:
             got_results(self.server_listing)
-        # Else... *gulp*... Call the list in.
+        # Else... *gulp*... Call the list in (unless we're already at it.)
         elif plus is not None:
-            _log().info("Fetching server list (ugh) to cherry-pick.")
-            plus.add_v1_account_transaction(
-                {
+            if self._listing_in_flight:
+                return
+            self._listing_in_flight = True
+            _LOG.info("Fetching server list (ugh) to cherry-pick.")
+            # Our query only changes along with our language.
+            lang = bs.app.lang.language
+            if self._listing_query.get("lang") != lang:
+                self._listing_query = {
                     "type": "PUBLIC_PARTY_QUERY",
                     "proto": bs.protocol_version(),
-                    "lang": bs.app.lang.language,
-                },
-                callback=bs.CallPartial(got_results),
+                    "lang": lang,
+                }
+            plus.add_v1_account_transaction(
+                self._listing_query,
+                callback=bs.CallPartial(got_results, fetched=True),
             )
-            self.last_listing_fetch = time.time() + SERVER_LISTING_UPDATE
 
-    def set_presence_online(self) -> None:
+    def set_presence_online(
+        self,
+        server: PartyEntry,
+        roster: list[dict[str, Any]],
+        activity_hash: int,
+    ) -> None:
         """Update our online game status."""
-        import ast
-
-        server: PartyEntry = bs.get_connection_to_host_info_2()
         # Get more server information if we haven't.
         if not self.current_server_data == server:
             self.server_entry = {}
@@ -741,28 +836,14 @@ class DiscordRPSubsystem(AppSubsystem):
         name = None
         if hasattr(server, "name") and not HIDE_ONLINE:
             name = server.name if len(server.name) > 2 else None
-        details = bs.Lstr(
-            value="${SERVER}",
-            subs=[
-                (
-                    "${SERVER}",
-                    name or (bs.Lstr(resource=f"{self.r}.session.private")),
-                )
-            ],
-        ).evaluate()
+        details = name or self._tr(f"{self.r}.session.private")
         player_count = max(
             1,
-            len(
-                [
-                    p
-                    for p in bs.get_game_roster()
-                    # Ignore the server by turning the "spec_string"
-                    # string into a proper dict. and checking the "a" val.
-                    if not (
-                        ast.literal_eval(p["spec_string"]).get("a", None)
-                        == "Server"
-                    )
-                ]
+            # Ignore the server by checking our "spec_string"s "a" val.
+            sum(
+                1
+                for p in roster
+                if not _is_server_spec(p.get("spec_string", ""))
             ),
         )
         # For whom reads this... Yes.
@@ -773,17 +854,15 @@ class DiscordRPSubsystem(AppSubsystem):
         self.data.update(
             {
                 "details": details,
-                "state": bs.Lstr(
-                    resource=f"{self.r}.players.online"
-                ).evaluate(),
+                "state": self._tr(f"{self.r}.players.online"),
                 "timestamps": {
-                    "start": self._get_start_time(),
+                    "start": self._get_start_time(activity_hash),
                 },
                 "assets": {
-                    "large_image": "claypocalypse_logo_final",
+                    **LOGO_ASSETS,
                     "large_text": self.large_image_idle_text(
-                        active=bs.Lstr(resource=f"{self.r}.play"),
-                        idle=bs.Lstr(resource=f"{self.r}.spectate"),
+                        active=self._tr(f"{self.r}.play"),
+                        idle=self._tr(f"{self.r}.spectate"),
                     ),
                 },
                 "party": {
@@ -801,75 +880,81 @@ class DiscordRPSubsystem(AppSubsystem):
                 }
             )
 
-    def set_presence_replay(self) -> None:
+    def set_presence_replay(
+        self, roster: list[dict[str, Any]], activity_hash: int
+    ) -> None:
         """Update our replay status."""
-        details = bs.Lstr(resource=f"{self.r}.replay").evaluate()
+        details = self._tr(f"{self.r}.replay")
         self.data.update(
             {
                 "details": details,
                 "timestamps": {
-                    "start": self._get_start_time(),
+                    "start": self._get_start_time(activity_hash),
                 },
                 "assets": {
-                    "large_image": "replay",
-                    "large_text": bs.Lstr(
-                        resource=f"{self.r}.watch"
-                    ).evaluate(),
+                    **REPLAY_ASSETS,
+                    "large_text": self._tr(f"{self.r}.watch"),
                 },
                 "instance": False,
             }
         )
         # We don't want a state here unless we're in a party.
-        self._hide_local_party_status()
+        self._hide_local_party_status(roster)
 
-    def set_presence_join(self) -> None:
+    def set_presence_join(
+        self, session: bs.Session, activity_hash: int
+    ) -> None:
         """Update our pre-game status."""
-        session: bs.Session = bs.get_foreground_host_session()
         details = self._get_game_details(
-            session, bs.Lstr(resource=f"{self.r}.lobby")
+            session, self._tr(f"{self.r}.lobby")
         )
-        state = bs.Lstr(resource=f"{self.r}.players.wait").evaluate()
+        state = self._tr(f"{self.r}.players.wait")
 
         self.data.update(
             {
                 "details": details,
                 "state": state,
                 "timestamps": {
-                    "start": self._get_start_time(),
+                    "start": self._get_start_time(activity_hash),
                 },
                 "assets": {
-                    "large_image": "claypocalypse_logo_final",
+                    **LOGO_ASSETS,
                     "large_text": state,
                 },
                 "instance": False,
             }
         )
 
-    def set_presence_main_menu(self) -> None:
+    def set_presence_main_menu(
+        self, roster: list[dict[str, Any]], activity_hash: int
+    ) -> None:
         """Update our main menu status."""
         self.data.update(
             {
-                "details": bs.Lstr(resource=f"{self.r}.menu").evaluate(),
+                "details": self._tr(f"{self.r}.menu"),
                 "timestamps": {
-                    "start": self._get_start_time(),
+                    "start": self._get_start_time(activity_hash),
                 },
                 "assets": {
-                    "large_image": "claypocalypse_logo_final",
+                    **LOGO_ASSETS,
                     "large_text": self.large_image_idle_text(
-                        active=bs.Lstr(resource=f"{self.r}.navigate")
+                        active=self._tr(f"{self.r}.navigate")
                     ),
                 },
                 "instance": False,
             }
         )
         # We don't want a state here unless we're in a party.
-        self._hide_local_party_status()
-
-    def set_presence_in_game(self) -> None:
+        self._hide_local_party_status(roster)
+
+    def set_presence_in_game(
+        self,
+        activity: bs.GameActivity,
+        session: bs.Session,
+        activity_hash: int,
+    ) -> None:
         """Update our game status."""
-        activity: bs.GameActivity = bs.get_foreground_host_activity()
-        session: bs.Session = bs.get_foreground_host_session()
-        end_time = self._get_end_time()
+        end_time = self._get_end_time(activity, activity_hash)
         activity_name = (
             activity.get_instance_scoreboard_display_string().evaluate()
         )
@@ -881,7 +966,7 @@ class DiscordRPSubsystem(AppSubsystem):
             {
                 "details": details,
                 "timestamps": {
-                    "start": self._get_start_time(),
+                    "start": self._get_start_time(activity_hash),
                 },
                 "assets": {
                     "large_image": self._get_map_large_image(activity),
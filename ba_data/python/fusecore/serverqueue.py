@@ -4,8 +4,10 @@
 
 from __future__ import annotations
 from dataclasses import dataclass
+import itertools
+import weakref
 from enum import Enum
-from typing import Any, override
+from typing import Any, ClassVar, override
 from babase._appsubsystem import AppSubsystem
 
 import bascenev1 as bs
@@ -19,23 +21,26 @@ from fusecore._tools import is_server
 
 from .common import CORE_FOLDER_NAME
 
-PERSISTENCY_CHECK_TIME: float = 0.012
+PERSISTENCY_CHECK_TIME: float = 0.15
+"""Seconds between checks for a foreground activity change."""
 
 NO_QUEUE_CONNECTION_ATTEMPTS: int = 24
 
 CUSTOMDATA_UI_ENTRY = "fuse:_serverqueueuielement"
 """Name ID to use when injecting our UI element in an activity."""
+CUSTOMDATA_SPINNER_TEXTURES = "fuse:_serverqueuespinnertex"
+"""Name ID to use when caching our spinner textures in an activity."""
 PRESERVE_UI = False
 """Do we show the queue UI on replays?"""
 
 ASSET_PATH: str = f"{CORE_FOLDER_NAME}/serverqueue"
 
 
-@dataclass
+@dataclass(slots=True)
 class NoActivityMsg: ...
 
 
-@dataclass
+@dataclass(slots=True)
 class ServerInfo:
     """Minimal server info. to serve our UI with."""
 
@@ -61,16 +66,53 @@ class QuitReason(Enum):
     QUIT = 3
 
 
+QUIT_REASON_COLOR = (1, 0.15, 0.15)
+_quit_reason_lstrs: dict[QuitReason | None, bs.Lstr] = {}
+
+
+def _get_quit_reason_lstr(reason: QuitReason | None) -> bs.Lstr:
+    """Get the message for a quit reason, building them on first use."""
+    if not _quit_reason_lstrs:
+        r = "serverqueue.messages.quit_by"
+        _quit_reason_lstrs.update(
+            {
+                QuitReason.UNKNOWN: bs.Lstr(resource=f"{r}.other"),
+                QuitReason.STOPPED: bs.Lstr(resource=f"{r}.cancel"),
+                QuitReason.FAILED: bs.Lstr(resource=f"{r}.failure"),
+            }
+        )
+    return _quit_reason_lstrs.get(
+        reason, _quit_reason_lstrs[QuitReason.UNKNOWN]
+    )
+
+
 class ServerQueueSubsystem(AppSubsystem):
     """Our subsystem to manage joining."""
 
+    __slots__ = (
+        "server_info",
+        "status",
+        "_has_queue",
+        "_ui_activity",
+        "_session_hash",
+        "_cached_activity",
+        "_cached_ui_element",
+        "persistency_check_timer",
+        "_persistency_cb",
+    )
+
     def __init__(self) -> None:
         self.server_info: ServerInfo | None = None
         self.status: QueueStatus = QueueStatus.NONE
+        self._has_queue: bool = False
 
-        self._activity_hash: str = ""
+        self._ui_activity: weakref.ref[bs.Activity] | None = None
+        """Activity we last placed our UI element in."""
         self._session_hash: str = ""
+        self._cached_activity: weakref.ref[bs.Activity] | None = None
+        self._cached_ui_element: ServerQueueUIElement | None = None
         self.persistency_check_timer: bs.AppTimer | None = None
+        self._persistency_cb = bs.WeakCallStrict(self.persistency_check)
 
     @override
     def on_app_running(self) -> None:
@@ -86,34 +128,35 @@ class ServerQueueSubsystem(AppSubsystem):
         self.queue_leave(reason=QuitReason.QUIT)
 
     def _active_queue(self) -> bool:
-        return (
-            not self.status is QueueStatus.NONE and self.server_info is not None
-        )
+        return self._has_queue and self.server_info is not None
 
     def persistency_check(self) -> None:
-        """Check if our activity and session have changed by hashing them repeatedly."""
-        if self.status is QueueStatus.NONE:
+        """Bring our UI element over if our foreground activity changed."""
+        if not self._active_queue():
             return
 
-        # TODO: kind of afraid that this might affect
-        # performance, even if just a little...
-        ui_element = self._get_ui_element()
-
-        if isinstance(ui_element, NoActivityMsg) or ui_element is not None:
+        activity = bs.get_foreground_host_activity()
+        if activity is None or (
+            self._ui_activity is not None and self._ui_activity() is activity
+        ):
             return
 
-        if self._active_queue():
-            self.ui_update()
+        if activity.customdata.get(CUSTOMDATA_UI_ENTRY, None) is None:
+            self.ui_create()
+        else:
+            self._ui_activity = weakref.ref(activity)
 
     def queue_join(self) -> None:
         """Queue ourselves into a server and show a pretty interface for it."""
         # some old and special servers don't allow for queues, create a
         # timer of our own and attempt connection a couple times for those.
         self.status = QueueStatus.IN_QUEUE
+        # set before creating our UI, which expects an active queue.
+        self._has_queue = True
 
         self.persistency_check_timer = bs.AppTimer(
             PERSISTENCY_CHECK_TIME,
-            bs.CallPartial(self.persistency_check),
+            self._persistency_cb,
             repeat=True,
         )
 
@@ -134,6 +177,7 @@ class ServerQueueSubsystem(AppSubsystem):
         This should only be done with debugging tools or in very specific
         circumstances where you don't want to bother the user with a message.
         """
+        self._has_queue = False
         self.server_info = None
         self.status = QueueStatus.NONE
         self.persistency_check_timer = None
@@ -146,18 +190,9 @@ class ServerQueueSubsystem(AppSubsystem):
 
     def show_quit_reason(self, reason: QuitReason | None) -> None:
         """Show a message with the reason we stopped queuing."""
-        r = "serverqueue.messages.quit_by"
-        lstr: bs.Lstr = bs.Lstr(resource=f"{r}.other")
-
-        match reason:
-            case QuitReason.UNKNOWN:
-                ...
-            case QuitReason.STOPPED:
-                lstr = bs.Lstr(resource=f"{r}.cancel")
-            case QuitReason.FAILED:
-                lstr = bs.Lstr(resource=f"{r}.failure")
-
-        bui.screenmessage(lstr, color=(1, 0.15, 0.15))
+        bui.screenmessage(
+            _get_quit_reason_lstr(reason), color=QUIT_REASON_COLOR
+        )
 
     def ui_create(self, do_intro: bool = False) -> None:
         """Create our pop-up display.
@@ -170,6 +205,8 @@ class ServerQueueSubsystem(AppSubsystem):
         if activity is None or self.server_info is None:
             return
 
+        self._cached_activity = None
+        self._cached_ui_element = None
         with activity.context:
             activity.customdata[CUSTOMDATA_UI_ENTRY] = ServerQueueUIElement(
                 self.server_info,
@@ -178,6 +215,7 @@ class ServerQueueSubsystem(AppSubsystem):
                 queue_status=self.status,
                 do_intro=do_intro,
             )
+        self._ui_activity = weakref.ref(activity)
 
         self.ui_update()
 
@@ -204,6 +242,7 @@ class ServerQueueSubsystem(AppSubsystem):
 
     def ui_delete(self, silent: bool = False) -> None:
         """Delete our pop-up display."""
+        self._ui_activity = None
         activity = bs.get_foreground_host_activity()
         if activity is None:
             return
@@ -212,23 +251,111 @@ class ServerQueueSubsystem(AppSubsystem):
         if isinstance(ui_element, ServerQueueUIElement):
             activity.customdata[CUSTOMDATA_UI_ENTRY].delete(silent=silent)
             activity.customdata[CUSTOMDATA_UI_ENTRY] = None
+        self._cached_activity = None
+        self._cached_ui_element = None
 
     def _get_ui_element(self) -> ServerQueueUIElement | NoActivityMsg | None:
         activity = bs.get_foreground_host_activity()
         if activity is None:
             return NoActivityMsg()
 
-        return activity.customdata.get(CUSTOMDATA_UI_ENTRY, None)
+        # compare against a weak reference rather than an id, as a new
+        # activity can end up at the address of one that just died.
+        cached = self._cached_activity
+        if cached is not None and cached() is activity:
+            return self._cached_ui_element
+
+        self._cached_activity = weakref.ref(activity)
+        self._cached_ui_element = activity.customdata.get(
+            CUSTOMDATA_UI_ENTRY, None
+        )
+        return self._cached_ui_element
 
     def _on_server_queue_response(self, response) -> None: ...
 
 
 UI_ICON_LAST_FRAME: int = 0
+SPINNER_FRAMES: int = 12
+
+_sounds: dict[str, bui.Sound] = {}
+
+
+def _get_sound(name: str) -> bui.Sound:
+    """Get a sound, loading it only the first time it's asked for."""
+    sound = _sounds.get(name)
+    if sound is None:
+        sound = _sounds[name] = bui.getsound(name)
+    return sound
+
+
+def _get_spinner_textures() -> tuple[bs.Texture, ...]:
+    """Get our spinner frames for the current activity.
+
+    Textures belong to the activity they were loaded in, so we keep them
+    in its customdata instead of a module global.
+    """
+    customdata = bs.getactivity().customdata
+    textures = customdata.get(CUSTOMDATA_SPINNER_TEXTURES, None)
+    if textures is None:
+        textures = customdata[CUSTOMDATA_SPINNER_TEXTURES] = tuple(
+            bs.gettexture(f"spinner{i}") for i in range(SPINNER_FRAMES)
+        )
+    return textures
+
+
+@dataclass(slots=True)
+class _NodeEntry:
+    """A node of our UI element along with its resting state."""
+
+    actor: bs.NodeActor
+    opacity: float
+    pos: tuple[float, float]
 
 
 class ServerQueueUIElement(bs.Actor):
     """An in-game display about our current queue."""
 
+    __slots__ = (
+        "misc_elements",
+        "position",
+        "align",
+        "sound_start",
+        "sound_join",
+        "sound_leave",
+        "icon_tex",
+        "icon_frame",
+        "server_info",
+        "queue_status",
+        "_nodes",
+        "_icon_cycle",
+        "_spinner_node",
+        "_label_server_node",
+        "_label_status_node",
+        "_last_pushed",
+    )
+
+    _status_texts: ClassVar[dict[QueueStatus, bs.Lstr | str]] = {}
+
+    _BACKDROP_ATTRS: ClassVar[dict[str, Any]] = {
+        "scale": (280, 125),
+        "rotate": -1.23,
+        "color": (0, 0, 0),
+        "front": True,
+    }
+    _SPINNER_ATTRS: ClassVar[dict[str, Any]] = {
+        "scale": (40, 40),
+        "color": (1, 1, 1),
+        "front": True,
+    }
+    _LABEL_ATTRS: ClassVar[dict[str, Any]] = {
+        "flatness": 0.0,
+        "color": (1, 1, 1, 1),
+        "shadow": 1.0,
+        "front": True,
+        "h_align": "left",
+        "v_align": "center",
+    }
+
     def __init__(
         self,
         server_info: ServerInfo,
@@ -237,19 +364,23 @@ class ServerQueueUIElement(bs.Actor):
         queue_status: QueueStatus = QueueStatus.NONE,
         do_intro: bool = False,
     ) -> None:
-        self.node_elements: dict[str, bs.NodeActor] = {}
-        self.node_defaults: dict[str, dict[str, Any]] = {}
+        self._nodes: dict[str, _NodeEntry] = {}
         self.misc_elements: dict[str, Any] = {}
         self.position = position
         self.align = align
 
-        self.sound_start: bui.Sound = bui.getsound(f"{ASSET_PATH}/start_queue")
-        self.sound_join: bui.Sound = bui.getsound(f"{ASSET_PATH}/join_attempt")
-        self.sound_leave: bui.Sound = bui.getsound("shieldDown")
-        self.icon_tex: list[bs.Texture] | None = [
-            bs.gettexture(f"spinner{i}") for i in range(12)
-        ]
+        self.sound_start: bui.Sound = _get_sound(f"{ASSET_PATH}/start_queue")
+        self.sound_join: bui.Sound = _get_sound(f"{ASSET_PATH}/join_attempt")
+        self.sound_leave: bui.Sound = _get_sound("shieldDown")
+        self.icon_tex: tuple[bs.Texture, ...] = _get_spinner_textures()
         self.icon_frame: int = UI_ICON_LAST_FRAME
+        self._icon_cycle = itertools.cycle(enumerate(self.icon_tex))
+        # pick up right after the frame the last spinner stopped at.
+        next(itertools.islice(self._icon_cycle, self.icon_frame, None))
+        self._spinner_node: bs.Node | None = None
+        self._label_server_node: bs.Node | None = None
+        self._label_status_node: bs.Node | None = None
+        self._last_pushed: tuple[str, QueueStatus] | None = None
 
         self.server_info = server_info
         self.queue_status = queue_status
@@ -262,133 +393,119 @@ class ServerQueueUIElement(bs.Actor):
                 bs.apptimer(3, self._animate_hide)
 
     def _create(self, intro: bool = False) -> None:
-        def e_scale(scale: float) -> tuple[float, float]:
-            return (1 * scale, 1 * scale)
-
         host_only = not PRESERVE_UI
+        attach = self.align.get_attach()
+        h_attach = self.align.get_h_attach()
+        v_attach = self.align.get_v_attach()
 
-        assert self.icon_tex
         x, y = self.position
-        self.node_defaults["backdrop"] = d = {
-            "position": (x, y - 2),
-            "opacity": 0.65,
-        }
-        self.node_elements["backdrop"] = bs.NodeActor(
-            bs.newnode(
-                "image",
-                attrs={
-                    "host_only": host_only,
-                    "texture": bs.gettexture("clayStroke"),
-                    "position": (x, y - 2),
-                    "scale": (280, 125),
-                    "rotate": -1.23,
-                    "color": (0, 0, 0),
-                    "opacity": 0 if intro else d["opacity"],
-                    "front": True,
-                    "attach": self.align.get_attach(),
-                },
-            )
+        pos, opacity = (x, y - 2), 0.65
+        self._nodes["backdrop"] = _NodeEntry(
+            bs.NodeActor(
+                bs.newnode(
+                    "image",
+                    attrs=self._BACKDROP_ATTRS
+                    | {
+                        "host_only": host_only,
+                        "texture": bs.gettexture("clayStroke"),
+                        "position": pos,
+                        "opacity": 0 if intro else opacity,
+                        "attach": attach,
+                    },
+                )
+            ),
+            opacity,
+            pos,
         )
-        self.node_defaults["spinner"] = d = {
-            "position": (x - 100, y),
-            "opacity": 1,
-        }
-        self.node_elements["spinner"] = bs.NodeActor(
-            bs.newnode(
-                "image",
-                attrs={
-                    "host_only": host_only,
-                    "texture": self.icon_tex[self.icon_frame],
-                    "position": (x - 100, y),
-                    "scale": e_scale(40),
-                    "color": (1, 1, 1),
-                    "opacity": 0 if intro else d["opacity"],
-                    "front": True,
-                    "attach": self.align.get_attach(),
-                },
-            )
+        pos, opacity = (x - 100, y), 1
+        self._nodes["spinner"] = _NodeEntry(
+            bs.NodeActor(
+                bs.newnode(
+                    "image",
+                    attrs=self._SPINNER_ATTRS
+                    | {
+                        "host_only": host_only,
+                        "texture": self.icon_tex[self.icon_frame],
+                        "position": pos,
+                        "opacity": 0 if intro else opacity,
+                        "attach": attach,
+                    },
+                )
+            ),
+            opacity,
+            pos,
         )
         # Use a weak callback so the timer does not keep a strong
         # reference to this UI element and prevent it from dying.
+        spin_cb = bui.WeakCallStrict(self._do_icon_spin)
         self.misc_elements["spinner_anim"] = bui.AppTimer(
-            1 / 16, bui.WeakCallStrict(self._do_icon_spin), repeat=True
+            1 / 16, spin_cb, repeat=True
         )
-        self.node_defaults["label_server"] = d = {
-            "position": (x - 75, y + 8),
-            "opacity": 1,
-        }
-        self.node_elements["label_server"] = bs.NodeActor(
-            bs.newnode(
-                "text",
-                attrs={
-                    "host_only": host_only,
-                    "text": self.server_info.name,
-                    "position": (x - 75, y + 8),
-                    "scale": 0.9,
-                    "maxwidth": 175,
-                    "flatness": 0.0,
-                    "color": (1, 1, 1, 1),
-                    "opacity": 0 if intro else d["opacity"],
-                    "shadow": 1.0,
-                    "front": True,
-                    "h_align": "left",
-                    "v_align": "center",
-                    "h_attach": self.align.get_h_attach(),
-                    "v_attach": self.align.get_v_attach(),
-                },
-            )
+        self._spinner_node = self._nodes["spinner"].actor.node
+        pos, opacity = (x - 75, y + 8), 1
+        self._nodes["label_server"] = _NodeEntry(
+            bs.NodeActor(
+                bs.newnode(
+                    "text",
+                    attrs=self._LABEL_ATTRS
+                    | {
+                        "host_only": host_only,
+                        "text": self.server_info.name,
+                        "position": pos,
+                        "scale": 0.9,
+                        "maxwidth": 175,
+                        "opacity": 0 if intro else opacity,
+                        "h_attach": h_attach,
+                        "v_attach": v_attach,
+                    },
+                )
+            ),
+            opacity,
+            pos,
         )
-        self.node_defaults["label_status"] = d = {
-            "position": (x - 75, y - 12),
-            "opacity": 1,
-        }
-        self.node_elements["label_status"] = bs.NodeActor(
-            bs.newnode(
-                "text",
-                attrs={
-                    "host_only": host_only,
-                    "text": "Waiting in queue... (2/12)",
-                    "position": (x - 75, y - 12),
-                    "scale": 0.65,
-                    "maxwidth": 250,
-                    "flatness": 0.0,
-                    "color": (1, 1, 1, 1),
-                    "opacity": 0 if intro else d["opacity"],
-                    "shadow": 1.0,
-                    "front": True,
-                    "h_align": "left",
-                    "v_align": "center",
-                    "h_attach": self.align.get_h_attach(),
-                    "v_attach": self.align.get_v_attach(),
-                },
-            )
+        pos, opacity = (x - 75, y - 12), 1
+        self._nodes["label_status"] = _NodeEntry(
+            bs.NodeActor(
+                bs.newnode(
+                    "text",
+                    attrs=self._LABEL_ATTRS
+                    | {
+                        "host_only": host_only,
+                        "text": "Waiting in queue... (2/12)",
+                        "position": pos,
+                        "scale": 0.65,
+                        "maxwidth": 250,
+                        "opacity": 0 if intro else opacity,
+                        "h_attach": h_attach,
+                        "v_attach": v_attach,
+                    },
+                )
+            ),
+            opacity,
+            pos,
         )
+        self._label_server_node = self._nodes["label_server"].actor.node
+        self._label_status_node = self._nodes["label_status"].actor.node
 
     def _animate_intro(self) -> None:
         self.sound_start.play()
         # animate a quick fade-in for all node actors we created.
-        for name, actor in self.node_elements.items():
-            if not isinstance(actor, bs.NodeActor):
-                continue
-            if not actor.node:
+        for entry in self._nodes.values():
+            node = entry.actor.node
+            if not node:
                 continue
-            default_opacity = self.node_defaults.get(name, {}).get("opacity", 1)
             bs.animate(
-                actor.node,
+                node,
                 "opacity",
-                {0.0: 0.0, 0.2: 0.0, 0.75: default_opacity},
+                {0.0: 0.0, 0.2: 0.0, 0.75: entry.opacity},
             )
 
     def _animate_hide(self) -> None:
-        for name, element in self.node_elements.items():
-            if not isinstance(element, bs.NodeActor):
-                continue
-            node = element.node
+        for entry in self._nodes.values():
+            node = entry.actor.node
             if not node:
                 continue
-            x, y = self.node_defaults.get(name, {}).get(
-                "position", (self.position)
-            )
+            x, y = entry.pos
             bs.animate_array(
                 node,
                 "position",
@@ -402,15 +519,11 @@ class ServerQueueUIElement(bs.Actor):
             )
 
     def _animate_show(self) -> None:
-        for name, element in self.node_elements.items():
-            if not isinstance(element, bs.NodeActor):
-                continue
-            node = element.node
+        for entry in self._nodes.values():
+            node = entry.actor.node
             if not node:
                 continue
-            x, y = self.node_defaults.get(name, {}).get(
-                "position", (self.position)
-            )
+            x, y = entry.pos
             bs.animate_array(
                 node,
                 "position",
@@ -419,31 +532,39 @@ class ServerQueueUIElement(bs.Actor):
             )
 
     def _do_icon_spin(self) -> None:
-        if (
-            self.icon_tex is None
-            or self.node_elements.get("spinner", None) is None
-        ):
+        node = self._spinner_node
+        if not node:
             return
 
-        frame = (self.icon_frame + 1) % len(self.icon_tex)
-        self.node_elements["spinner"].node.texture = self.icon_tex[frame]
-
-        global UI_ICON_LAST_FRAME  # pylint: disable=global-statement
-        UI_ICON_LAST_FRAME = self.icon_frame = frame
+        self.icon_frame, node.texture = next(self._icon_cycle)
 
     def update(self, server_info: ServerInfo, status: QueueStatus) -> None:
         """Update our server info and queue status data."""
         self.server_info = server_info
         self.queue_status = status
 
+        key = (server_info.name, status)
+        if key == self._last_pushed:
+            return
+        self._last_pushed = key
+
         self._update_text()
 
     def _update_text(self) -> None:
-        self.node_elements["label_server"].node.text = self.server_info.name
-        self.node_elements["label_status"].node.text = self._get_status_text()
+        node = self._label_server_node
+        if node:
+            node.text = self.server_info.name
+        node = self._label_status_node
+        if node:
+            node.text = self._get_status_text()
 
     def _get_status_text(self) -> bs.Lstr | str:
-        return bs.Lstr(resource="serverqueue.status.in_queue")
+        text = self._status_texts.get(self.queue_status, None)
+        if text is None:
+            text = self._status_texts[self.queue_status] = bs.Lstr(
+                resource="serverqueue.status.in_queue"
+            )
+        return text
 
     def delete(self, silent: bool = False) -> None:
         """Delete the node contents of this actor."""
@@ -453,8 +574,15 @@ class ServerQueueUIElement(bs.Actor):
 
     @override
     def on_expire(self) -> None:
-        self.node_elements.clear()
-        self.icon_tex = None
+        self._nodes.clear()
+        # drops our spinner timer too.
+        self.misc_elements.clear()
+        self._spinner_node = None
+        self._label_server_node = None
+        self._label_status_node = None
+
+        global UI_ICON_LAST_FRAME  # pylint: disable=global-statement
+        UI_ICON_LAST_FRAME = self.icon_frame
         self.sound_start = None
         self.sound_join = None
         self.sound_leave = None